@@ -0,0 +1,197 @@
+"""
+Analytics Module - Time-bucketed activity series for the dashboard chart
+=========================================================================
+
+One analytics_buckets document per hour and per day (UTC), updated with
+$inc next to the writes that produce activity:
+
+    uploads      policies ingested for the first time
+    processed    tasks moved to COMPLETED
+    exported     PDF reports delivered (single downloads and ZIP entries)
+
+Range queries read at most a few hundred bucket documents instead of
+scanning policies and the audit log. Like stats_counters, the buckets are
+not transactional with the writes they follow; the rollup command rebuilds
+uploads and processed from the source collections with $dateTrunc and
+$merge. exported has no source collection, so the rollup leaves it as is.
+
+Usage:
+    python -m app.analytics             # rebuild every bucket
+    python -m app.analytics --days 30   # rebuild the last 30 days only
+"""
+import asyncio
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Optional
+from pymongo import UpdateOne
+from app.db import get_db
+
+SERIES = ["uploads", "processed", "exported"]
+GRANULARITIES = ["hour", "day"]
+
+# range -> (bucket granularity, number of buckets read, point period, point label)
+PERFORMANCE_RANGES = {
+    "24h": ("hour", 24, "hour", "%H:00"),
+    "7d": ("day", 7, "day", "%a"),
+    "30d": ("day", 30, "day", "%b %d"),
+    "365d": ("day", 365, "month", "%b %Y")
+}
+
+
+def bucket_start(at: datetime, granularity: str) -> datetime:
+    """Start of the hour or day containing at."""
+    if granularity == "hour":
+        return at.replace(minute=0, second=0, microsecond=0)
+    return at.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def bucket_id(granularity: str, start: datetime) -> str:
+    return f"{granularity}:{start.isoformat()}"
+
+
+class BucketDeltas:
+    """
+    Pending $inc amounts per bucket, flushed in one bulk_write.
+
+    Every event is counted in both its hourly and its daily bucket.
+    """
+
+    def __init__(self):
+        self._deltas = defaultdict(lambda: defaultdict(int))
+
+    def add(self, series: str, at: datetime, amount: int = 1) -> None:
+        for granularity in GRANULARITIES:
+            self._deltas[(granularity, bucket_start(at, granularity))][series] += amount
+
+    async def flush(self, db) -> None:
+        operations = [
+            UpdateOne(
+                {"_id": bucket_id(granularity, start)},
+                {"$inc": increments, "$setOnInsert": {"granularity": granularity, "start": start}},
+                upsert=True
+            )
+            for (granularity, start), increments in self._deltas.items()
+            if any(increments.values())
+        ]
+        self._deltas.clear()
+        if operations:
+            await db.analytics_buckets.bulk_write(operations, ordered=False)
+
+
+async def record_activity(db, series: str, amount: int = 1, at: Optional[datetime] = None) -> None:
+    """Count amount events of one series at the given time (default: now)."""
+    if amount:
+        deltas = BucketDeltas()
+        deltas.add(series, at or datetime.utcnow(), amount)
+        await deltas.flush(db)
+
+
+async def read_performance(db, range_key: str, now: Optional[datetime] = None) -> dict:
+    """
+    Build the /analytics/performance series for a range.
+
+    Args:
+        db: Motor database handle
+        range_key: One of PERFORMANCE_RANGES
+        now: End of the range (default: now), mainly for tests
+
+    Returns:
+        {"range", "granularity", "data": [{"name", "start", <series>...}]},
+        oldest point first, with zeros for periods without activity
+    """
+    granularity, count, period, label = PERFORMANCE_RANGES[range_key]
+    step = timedelta(hours=1) if granularity == "hour" else timedelta(days=1)
+    last = bucket_start(now or datetime.utcnow(), granularity)
+    first = last - step * (count - 1)
+
+    buckets = await db.analytics_buckets.find(
+        {"granularity": granularity, "start": {"$gte": first, "$lte": last}},
+        {"_id": 0, "start": 1, **{series: 1 for series in SERIES}}
+    ).to_list(length=count)
+    by_start = {bucket["start"]: bucket for bucket in buckets}
+
+    points = {}
+    for index in range(count):
+        start = first + step * index
+        # Daily buckets are summed into months for the yearly range
+        period_start = start.replace(day=1) if period == "month" else start
+        point = points.setdefault(period_start, {
+            "name": period_start.strftime(label),
+            "start": period_start.isoformat(),
+            **{series: 0 for series in SERIES}
+        })
+        bucket = by_start.get(start, {})
+        for series in SERIES:
+            point[series] += bucket.get(series, 0)
+
+    return {"range": range_key, "granularity": period, "data": list(points.values())}
+
+
+def _rollup_pipeline(series: str, time_expression, granularity: str, since: Optional[datetime]) -> list[dict]:
+    """Count documents per $dateTrunc bucket and $merge the totals into analytics_buckets."""
+    start = {"$dateTrunc": {"date": "$at", "unit": granularity}}
+    pipeline = [{"$project": {"_id": 0, "at": time_expression}}]
+    if since is not None:
+        pipeline.append({"$match": {"at": {"$gte": since}}})
+    pipeline += [
+        {"$group": {"_id": start, series: {"$sum": 1}}},
+        {"$project": {
+            "_id": {"$concat": [f"{granularity}:", {"$dateToString": {
+                "date": "$_id", "format": "%Y-%m-%dT%H:%M:%S"
+            }}]},
+            "granularity": granularity,
+            "start": "$_id",
+            series: 1
+        }},
+        # Only this series is replaced; the other counters of the bucket are kept
+        {"$merge": {"into": "analytics_buckets", "on": "_id", "whenMatched": "merge", "whenNotMatched": "insert"}}
+    ]
+    return pipeline
+
+
+async def rollup_buckets(db, since: Optional[datetime] = None) -> int:
+    """
+    Rebuild uploads and processed from the source collections.
+
+    Policies count at created_at, or the creation time of their ObjectId
+    for policies written before created_at existed; completions count at
+    the timestamp of their "-> COMPLETED" audit log.
+
+    Args:
+        db: Motor database handle
+        since: Only rebuild buckets starting at or after this time
+
+    Returns:
+        Number of bucket documents in the rebuilt window
+    """
+    window = {}
+    if since is not None:
+        since = bucket_start(since, "day")
+        window["start"] = {"$gte": since}
+
+    # Buckets whose source documents are gone must drop back to zero
+    await db.analytics_buckets.update_many(window, {"$set": {"uploads": 0, "processed": 0}})
+
+    for granularity in GRANULARITIES:
+        await db.policies.aggregate(
+            _rollup_pipeline("uploads", {"$ifNull": ["$created_at", {"$toDate": "$_id"}]}, granularity, since)
+        ).to_list(length=None)
+        await db.audit_logs.aggregate(
+            [{"$match": {"action": {"$regex": "-> COMPLETED$"}}}]
+            + _rollup_pipeline("processed", "$timestamp", granularity, since)
+        ).to_list(length=None)
+
+    return await db.analytics_buckets.count_documents(window)
+
+
+async def run_rollup(days: Optional[int]) -> None:
+    since = datetime.utcnow() - timedelta(days=days) if days else None
+    print("Rebuilding analytics buckets" + (f" for the last {days} days..." if days else "..."))
+    buckets = await rollup_buckets(get_db(), since=since)
+    print(f"   ✅ {buckets} buckets rebuilt")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    asyncio.run(run_rollup(int(args[args.index("--days") + 1]) if "--days" in args else None))
@@ -0,0 +1,348 @@
+"""
+Counters Module - Incrementally maintained dashboard counters
+===============================================================
+
+One stats_counters document per scope, updated with $inc next to every
+write that changes what the dashboards count:
+
+    global           policies_total, policies_active, tasks_total, status.*
+    policy:<id>      tasks_total, status.*, role.*, completion_count, completion_ms
+    role:<role_key>  tasks_total, status.*
+
+Counter updates are not transactional with the writes they follow, so a
+crash in between leaves them off by the missed update. The reconcile
+command rebuilds every counter from the source collections and reports
+the drift it corrected; counters are only served once it has run.
+
+Usage:
+    python -m app.counters            # rebuild and report drift
+    python -m app.counters --dry-run  # report drift only
+"""
+import asyncio
+import sys
+from collections import defaultdict
+from datetime import datetime
+from typing import Optional
+from pymongo import DeleteOne, ReplaceOne, UpdateOne
+from app.db import get_db
+from app.schemas import normalize_role
+from app.stats import TASK_STATUSES
+
+GLOBAL_SCOPE = "global"
+
+
+def policy_scope(policy_id: str) -> str:
+    return f"policy:{policy_id}"
+
+
+def role_scope(role_key: str) -> str:
+    return f"role:{role_key}"
+
+
+def _field_key(value: Optional[str], default: str) -> str:
+    """Counter field name for a status or role; '.' and '$' cannot appear in update paths."""
+    return (value or default).replace(".", "_").replace("$", "_")
+
+
+def _duration_ms(start: datetime, end: datetime) -> int:
+    # MongoDB stores milliseconds; truncate both ends the same way so
+    # incremental and reconciled totals agree exactly
+    return int(end.timestamp() * 1000) - int(start.timestamp() * 1000)
+
+
+class CounterDeltas:
+    """
+    Pending $inc amounts per scope, flushed in one bulk_write.
+
+    A change to a task is recorded as removing the task's old state and
+    adding its new one; contributions that cancel out are never written.
+    """
+
+    def __init__(self):
+        self._deltas = defaultdict(lambda: defaultdict(int))
+
+    def add(self, scope: str, field: str, amount: int = 1) -> None:
+        self._deltas[scope][field] += amount
+
+    def add_task(self, task: dict, amount: int = 1) -> None:
+        """Count (amount=1) or uncount (amount=-1) a task in every scope it belongs to."""
+        status = _field_key(task.get("status"), "CREATED")
+        role = task.get("assigned_role")
+        for scope in (GLOBAL_SCOPE, policy_scope(task["policy_id"]), role_scope(normalize_role(role or ""))):
+            self.add(scope, "tasks_total", amount)
+            self.add(scope, f"status.{status}", amount)
+        self.add(policy_scope(task["policy_id"]), f"role.{_field_key(role, 'Unknown')}", amount)
+
+    def move_policy(self, before: Optional[dict], after: dict) -> None:
+        """Count a policy insert (before is None) or a change of its status."""
+        if before is None:
+            self.add(GLOBAL_SCOPE, "policies_total")
+        was_active = before is not None and before.get("status") == "ACTIVE"
+        self.add(GLOBAL_SCOPE, "policies_active", int(after.get("status") == "ACTIVE") - int(was_active))
+
+    def move_task(self, before: dict, after: dict) -> None:
+        self.add_task(before, -1)
+        self.add_task(after, 1)
+
+    def add_completion(self, task: dict, completed_at: datetime) -> None:
+        """Record how long a task took from creation to completion, when known."""
+        created_at = task.get("created_at")
+        if not isinstance(created_at, datetime):
+            return
+        duration_ms = _duration_ms(created_at, completed_at)
+        if duration_ms > 0:
+            scope = policy_scope(task["policy_id"])
+            self.add(scope, "completion_count")
+            self.add(scope, "completion_ms", duration_ms)
+
+    def nonzero(self) -> dict[str, dict[str, int]]:
+        """Pending amounts per scope, keyed by dotted counter path, without zeros."""
+        deltas = {
+            scope: {field: amount for field, amount in fields.items() if amount}
+            for scope, fields in self._deltas.items()
+        }
+        return {scope: fields for scope, fields in deltas.items() if fields}
+
+    async def flush(self, db) -> None:
+        operations = [
+            UpdateOne({"_id": scope}, {"$inc": increments}, upsert=True)
+            for scope, increments in self.nonzero().items()
+        ]
+        self._deltas.clear()
+        if operations:
+            await db.stats_counters.bulk_write(operations, ordered=False)
+
+
+async def reset_counters(db) -> None:
+    """Start from empty counters that are trusted, e.g. after wiping every collection."""
+    await db.stats_counters.delete_many({})
+    await db.stats_counters.insert_one({"_id": GLOBAL_SCOPE, "reconciled_at": datetime.utcnow()})
+
+
+async def read_policy_stats(db) -> Optional[dict]:
+    """
+    /policies/stats from the global counters, or None until they have been
+    reconciled at least once.
+    """
+    counters = await db.stats_counters.find_one({"_id": GLOBAL_SCOPE})
+    if not counters or "reconciled_at" not in counters:
+        return None
+
+    status = counters.get("status", {})
+    total_policies = counters.get("policies_total", 0)
+    active_policies = counters.get("policies_active", 0)
+    return {
+        "total_policies": total_policies,
+        "active_policies": active_policies,
+        "completed_policies": 0,  # Can be calculated based on all tasks completed
+        "pending_policies": total_policies - active_policies,
+        "total_tasks": counters.get("tasks_total", 0),
+        "created_tasks": status.get("CREATED", 0),
+        "assigned_tasks": status.get("ASSIGNED", 0),
+        "in_progress_tasks": status.get("IN_PROGRESS", 0),
+        "completed_tasks": status.get("COMPLETED", 0),
+        "escalated_tasks": status.get("ESCALATED", 0)
+    }
+
+
+async def read_single_policy_stats(db, policy_id: str) -> Optional[dict]:
+    """
+    /policies/stats/{policy_id} from the policy's counters, or None until
+    the counters have been reconciled at least once.
+    """
+    global_counters, counters = await asyncio.gather(
+        db.stats_counters.find_one({"_id": GLOBAL_SCOPE}, {"reconciled_at": 1}),
+        db.stats_counters.find_one({"_id": policy_scope(policy_id)})
+    )
+    if not global_counters or "reconciled_at" not in global_counters:
+        return None
+    counters = counters or {}
+
+    tasks_by_status = {status: 0 for status in TASK_STATUSES}
+    tasks_by_status.update(counters.get("status", {}))
+    tasks_by_role = {role: count for role, count in counters.get("role", {}).items() if count}
+    total_tasks = counters.get("tasks_total", 0)
+
+    completion_rate = 0
+    if total_tasks > 0:
+        completion_rate = int((tasks_by_status["COMPLETED"] / total_tasks) * 100)
+
+    average_hours = 0
+    if counters.get("completion_count"):
+        average_hours = round(counters["completion_ms"] / counters["completion_count"] / 3_600_000, 2)
+
+    return {
+        "policy_id": policy_id,
+        "total_tasks": total_tasks,
+        "tasks_by_status": tasks_by_status,
+        "tasks_by_role": tasks_by_role,
+        "completion_rate_percent": completion_rate,
+        "average_completion_time_hours": average_hours
+    }
+
+
+async def read_task_stats(db, role_key: Optional[str] = None) -> Optional[dict]:
+    """
+    /tasks/stats from the global or role counters, or None until the
+    counters have been reconciled at least once.
+    """
+    scope = role_scope(role_key) if role_key else GLOBAL_SCOPE
+    global_counters, counters = await asyncio.gather(
+        db.stats_counters.find_one({"_id": GLOBAL_SCOPE}, {"reconciled_at": 1}),
+        db.stats_counters.find_one({"_id": scope}, {"tasks_total": 1, "status": 1})
+    )
+    if not global_counters or "reconciled_at" not in global_counters:
+        return None
+    counters = counters or {}
+
+    tasks_by_status = {status: 0 for status in TASK_STATUSES}
+    tasks_by_status.update(counters.get("status", {}))
+    return {"role_key": role_key, "total_tasks": counters.get("tasks_total", 0), "tasks_by_status": tasks_by_status}
+
+
+async def _expected_counters(db) -> dict[str, dict]:
+    """Rebuild every counter document from the source collections."""
+    policy_pipeline = [
+        {"$group": {
+            "_id": None,
+            "total": {"$sum": 1},
+            "active": {"$sum": {"$cond": [{"$eq": ["$status", "ACTIVE"]}, 1, 0]}}
+        }}
+    ]
+    task_pipeline = [
+        {"$group": {
+            "_id": {"policy_id": "$policy_id", "status": "$status", "assigned_role": "$assigned_role"},
+            "count": {"$sum": 1}
+        }}
+    ]
+    # Same TASK_CREATED -> "-> COMPLETED" audit-log span as the aggregation stats
+    completion_pipeline = [
+        {"$match": {"status": "COMPLETED"}},
+        {"$lookup": {
+            "from": "audit_logs",
+            "localField": "task_id",
+            "foreignField": "task_id",
+            "pipeline": [
+                {"$match": {"$or": [
+                    {"action": "TASK_CREATED"},
+                    {"action": {"$regex": "-> COMPLETED$"}}
+                ]}},
+                {"$project": {"_id": 0, "timestamp": 1}}
+            ],
+            "as": "logs"
+        }},
+        {"$project": {
+            "policy_id": 1,
+            "duration_ms": {"$subtract": [
+                {"$max": "$logs.timestamp"},
+                {"$min": "$logs.timestamp"}
+            ]}
+        }},
+        {"$match": {"duration_ms": {"$gt": 0}}},
+        {"$group": {
+            "_id": "$policy_id",
+            "total_ms": {"$sum": "$duration_ms"},
+            "count": {"$sum": 1}
+        }}
+    ]
+
+    policy_rows, task_rows, completion_rows = await asyncio.gather(
+        db.policies.aggregate(policy_pipeline).to_list(length=1),
+        db.tasks.aggregate(task_pipeline, allowDiskUse=True).to_list(length=None),
+        db.tasks.aggregate(completion_pipeline, allowDiskUse=True).to_list(length=None)
+    )
+
+    deltas = CounterDeltas()
+    if policy_rows:
+        deltas.add(GLOBAL_SCOPE, "policies_total", policy_rows[0]["total"])
+        deltas.add(GLOBAL_SCOPE, "policies_active", policy_rows[0]["active"])
+    for row in task_rows:
+        deltas.add_task(row["_id"], row["count"])
+    for row in completion_rows:
+        scope = policy_scope(row["_id"])
+        deltas.add(scope, "completion_count", row["count"])
+        deltas.add(scope, "completion_ms", row["total_ms"])
+    return deltas.nonzero()
+
+
+def _flatten(document: dict, prefix: str = "") -> dict[str, int]:
+    flat = {}
+    for key, value in document.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, int) and value:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def _nest(flat: dict[str, int]) -> dict:
+    document = {}
+    for path, value in flat.items():
+        *parents, leaf = path.split(".")
+        node = document
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[leaf] = value
+    return document
+
+
+async def reconcile_counters(db, dry_run: bool = False) -> dict:
+    """
+    Rebuild stats_counters from the source collections and report drift.
+
+    Args:
+        db: Motor database handle
+        dry_run: Only report drift, leave the counters untouched
+
+    Returns:
+        {"scopes": <number of scopes>, "drift": {scope: {field: {"stored", "actual"}}}}
+    """
+    expected = await _expected_counters(db)
+    expected.setdefault(GLOBAL_SCOPE, {})
+
+    stored = {}
+    async for document in db.stats_counters.find():
+        scope = document.pop("_id")
+        document.pop("reconciled_at", None)
+        stored[scope] = _flatten(document)
+
+    drift = {}
+    for scope in expected.keys() | stored.keys():
+        actual, current = expected.get(scope, {}), stored.get(scope, {})
+        fields = {
+            field: {"stored": current.get(field, 0), "actual": actual.get(field, 0)}
+            for field in actual.keys() | current.keys()
+            if current.get(field, 0) != actual.get(field, 0)
+        }
+        if fields:
+            drift[scope] = fields
+
+    if not dry_run:
+        now = datetime.utcnow()
+        operations = [
+            ReplaceOne(
+                {"_id": scope},
+                {**_nest(fields), **({"reconciled_at": now} if scope == GLOBAL_SCOPE else {})},
+                upsert=True
+            )
+            for scope, fields in expected.items()
+        ]
+        operations += [DeleteOne({"_id": scope}) for scope in stored.keys() - expected.keys()]
+        await db.stats_counters.bulk_write(operations, ordered=False)
+
+    return {"scopes": len(expected), "drift": drift}
+
+
+async def run_reconcile(dry_run: bool) -> None:
+    print("Reconciling stats counters..." if not dry_run else "Checking stats counters (dry run)...")
+    report = await reconcile_counters(get_db(), dry_run=dry_run)
+    print(f"   {report['scopes']} scopes, {len(report['drift'])} with drift")
+    for scope, fields in sorted(report["drift"].items()):
+        for field, values in sorted(fields.items()):
+            print(f"   ❌ {scope} {field}: stored {values['stored']}, actual {values['actual']}")
+    if not report["drift"]:
+        print("   ✅ Counters match the source collections")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_reconcile(dry_run="--dry-run" in sys.argv[1:]))
@@ -0,0 +1,92 @@
+"""
+Events Module - In-process broadcaster of task changes for WebSocket/SSE clients
+"""
+import asyncio
+from datetime import datetime
+from typing import Iterable, Optional
+from app.schemas import normalize_role
+from app.settings import EVENT_QUEUE_SIZE
+
+
+class Subscription:
+    """
+    One connected client's queue of pending events.
+
+    A role-scoped subscription only receives events touching that role; an
+    unscoped (or Admin) one receives everything. If the client falls
+    EVENT_QUEUE_SIZE events behind, its backlog is replaced by a single
+    "resync" event telling it to refetch instead of applying deltas.
+    """
+
+    def __init__(self, role: Optional[str], maxsize: int):
+        role_key = normalize_role(role) if role else None
+        self.role_key = None if role_key == "admin" else role_key
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    def matches(self, event: dict) -> bool:
+        return self.role_key is None or self.role_key in event["roles"]
+
+    def offer(self, event: dict) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait({"type": "resync", "timestamp": event["timestamp"]})
+
+    async def get(self) -> dict:
+        return await self._queue.get()
+
+
+class EventBroker:
+    """
+    Fans task events out to subscribers in this worker process.
+
+    Publishing never blocks the request that produced the change. Events
+    are not persisted or shared between worker processes, so a client only
+    sees changes handled by the worker it is connected to.
+    """
+
+    def __init__(self, queue_size: int = EVENT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscriptions: set[Subscription] = set()
+
+    def subscribe(self, role: Optional[str] = None) -> Subscription:
+        subscription = Subscription(role, self.queue_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def publish(self, event_type: str, task: dict, roles: Iterable[str], **details) -> None:
+        """
+        Send a task event to every matching subscriber.
+
+        Args:
+            event_type: task.created, task.updated, task.status_changed or
+                task.escalated
+            task: The task as returned by the API
+            roles: Normalized role keys the change is visible to (e.g. both
+                the old and the new role of an escalated task)
+            **details: Extra event fields, such as the previous status
+        """
+        if not self._subscriptions:
+            return
+        event = {
+            "type": event_type,
+            "task": task,
+            "roles": sorted(set(roles)),
+            "timestamp": datetime.utcnow().isoformat(),
+            **details
+        }
+        for subscription in self._subscriptions:
+            if subscription.matches(event):
+                subscription.offer(event)
+
+
+event_broker = EventBroker()
@@ -0,0 +1,121 @@
+"""
+Export Module - Streams many NLP result PDFs back as a single ZIP archive
+"""
+import asyncio
+import json
+import os
+import zipfile
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Optional
+from app.pdf_jobs import pdf_jobs
+from app.rendering import RenderQueueFull, render_executor
+
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+class _ZipSink:
+    """
+    Write-only, unseekable buffer for zipfile.
+
+    zipfile falls back to data descriptors when it cannot seek, so entries
+    can be emitted as soon as they are written; drain() hands back whatever
+    has accumulated since the last call.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def pdf_download_name(result: dict) -> str:
+    """File name a result's PDF is served under."""
+    safe_policy_id = result["policy_id"].replace("/", "_").replace("\\", "_")
+    return f"policy_{safe_policy_id}.pdf"
+
+
+async def _render(result: dict, slots: asyncio.Semaphore) -> tuple[dict, Optional[str], Optional[str]]:
+    """
+    Render (or reuse) one result's PDF, waiting for room on the executor.
+
+    An export has already started streaming by the time it renders, so a
+    full queue is waited out rather than turned into a 503.
+
+    Returns:
+        (result, path of the PDF or None, error message or None)
+    """
+    async with slots:
+        while True:
+            try:
+                path, _ = await pdf_jobs.ensure_artifact(result)
+                return result, path, None
+            except RenderQueueFull:
+                await asyncio.sleep(0.5)
+            except Exception as e:
+                return result, None, str(e)
+
+
+async def stream_pdf_zip(
+    results: list[dict],
+    missing: list[str],
+    on_finish: Optional[Callable[[dict], Awaitable[None]]] = None
+) -> AsyncIterator[bytes]:
+    """
+    Render PDFs in parallel and stream them as one ZIP archive.
+
+    Each PDF is added to the archive as soon as its render finishes, so the
+    client starts receiving bytes after the first report instead of the
+    last. PDFs are already compressed, so entries are stored rather than
+    deflated. A manifest.json listing exported, missing and failed results
+    closes the archive.
+
+    Args:
+        results: nlp_results documents to export
+        missing: requested result ids that were not found
+        on_finish: Awaited with the manifest once the archive has been sent
+    """
+    slots = asyncio.Semaphore(render_executor.max_workers)
+    renders = [asyncio.ensure_future(_render(result, slots)) for result in results]
+    sink = _ZipSink()
+    manifest = {"exported": [], "missing": missing, "failed": []}
+    used_names: set[str] = set()
+
+    try:
+        with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as archive:
+            for render in asyncio.as_completed(renders):
+                result, path, error = await render
+                if error is not None:
+                    manifest["failed"].append({"result_id": result["result_id"], "error": error})
+                    continue
+
+                name = pdf_download_name(result)
+                if name in used_names:
+                    name = f"{name[:-4]}_{result['result_id']}.pdf"
+                used_names.add(name)
+
+                info = zipfile.ZipInfo(name, date_time=datetime.utcnow().timetuple()[:6])
+                info.file_size = os.path.getsize(path)
+                with open(path, "rb") as source, archive.open(info, "w") as entry:
+                    while chunk := source.read(EXPORT_CHUNK_SIZE):
+                        entry.write(chunk)
+                        yield sink.drain()
+                yield sink.drain()
+                manifest["exported"].append({"result_id": result["result_id"], "file": name})
+
+            archive.writestr("manifest.json", json.dumps(manifest, indent=2))
+        yield sink.drain()
+        if on_finish is not None:
+            await on_finish(manifest)
+    finally:
+        for render in renders:
+            render.cancel()
@@ -0,0 +1,144 @@
+"""
+Index Provisioning Module - Declares and ensures MongoDB indexes
+"""
+import logging
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+# Index plan per collection. create_indexes() is a no-op for indexes that
+# already exist with the same spec, so this is safe to run on every startup.
+INDEX_PLAN = {
+    "policies": [
+        IndexModel([("policy_id", ASCENDING)], name="policy_id_unique", unique=True),
+    ],
+    "tasks": [
+        IndexModel([("task_id", ASCENDING)], name="task_id_unique", unique=True),
+        # One task per rule; serves the per-batch existing-rule lookup of ingestion
+        IndexModel([("policy_id", ASCENDING), ("rule_id", ASCENDING)], name="policy_rule_unique", unique=True),
+        IndexModel(
+            [("policy_id", ASCENDING), ("status", ASCENDING), ("assigned_role", ASCENDING)],
+            name="policy_status_role"
+        ),
+        # Equality filter + task_id keyset order used by GET /tasks pagination
+        IndexModel([("assigned_role_key", ASCENDING), ("task_id", ASCENDING)], name="role_key_task_id"),
+        IndexModel([("policy_id", ASCENDING), ("task_id", ASCENDING)], name="policy_task_id"),
+        IndexModel([("status", ASCENDING), ("task_id", ASCENDING)], name="status_task_id"),
+    ],
+    "audit_logs": [
+        IndexModel([("timestamp", DESCENDING)], name="timestamp_desc"),
+        IndexModel([("task_id", ASCENDING)], name="task_id"),
+    ],
+    "nlp_results": [
+        IndexModel([("result_id", ASCENDING)], name="result_id_unique", unique=True),
+        # Keyset order used by GET /nlp-results pagination; also serves date ranges
+        IndexModel(
+            [("upload_timestamp", DESCENDING), ("result_id", DESCENDING)],
+            name="upload_timestamp_result_id"
+        ),
+    ],
+    "analytics_buckets": [
+        # Range reads of GET /analytics/performance
+        IndexModel([("granularity", ASCENDING), ("start", ASCENDING)], name="granularity_start"),
+    ],
+}
+
+# Queries issued by the hot endpoints, explained by /admin/indexes to confirm
+# they are served by an IXSCAN rather than a COLLSCAN.
+# (name, collection, filter, sort)
+HOT_QUERIES = [
+    ("policy_by_id", "policies", {"policy_id": "__probe__"}, None),
+    ("task_by_id", "tasks", {"task_id": "__probe__"}, None),
+    ("tasks_by_policy", "tasks", {"policy_id": "__probe__"}, None),
+    ("tasks_by_policy_rules", "tasks", {"policy_id": "__probe__", "rule_id": {"$in": ["R1", "R2"]}}, None),
+    ("tasks_by_role", "tasks", {"assigned_role_key": "clerk"}, [("task_id", ASCENDING)]),
+    ("tasks_page", "tasks", {}, [("task_id", ASCENDING)]),
+    ("audit_logs_recent", "audit_logs", {}, [("timestamp", DESCENDING)]),
+    ("audit_logs_by_task", "audit_logs", {"task_id": "__probe__"}, None),
+    ("nlp_result_by_id", "nlp_results", {"result_id": "__probe__"}, None),
+    ("nlp_results_page", "nlp_results", {}, [("upload_timestamp", DESCENDING), ("result_id", DESCENDING)]),
+    ("performance_range", "analytics_buckets", {"granularity": "day"}, [("start", ASCENDING)]),
+]
+
+
+async def ensure_indexes(db) -> dict:
+    """
+    Create every index in INDEX_PLAN that does not exist yet.
+
+    Indexes are created one by one so that a single failure (for example a
+    unique index over pre-existing duplicates) is logged and reported
+    without blocking the rest of the plan or the application startup.
+
+    Args:
+        db: Motor database handle
+
+    Returns:
+        Mapping of collection name to {"ensured": [...], "failed": {...}}
+    """
+    report = {}
+    for collection_name, indexes in INDEX_PLAN.items():
+        ensured = []
+        failed = {}
+        for index in indexes:
+            name = index.document["name"]
+            try:
+                await db[collection_name].create_indexes([index])
+                ensured.append(name)
+            except OperationFailure as e:
+                logger.warning("Could not create index %s.%s: %s", collection_name, name, e)
+                failed[name] = str(e)
+        report[collection_name] = {"ensured": ensured, "failed": failed}
+    return report
+
+
+def _plan_stages(plan: dict) -> list[str]:
+    """Flatten an explain() winning plan into its list of stage names."""
+    stages = []
+    pending = [plan]
+    while pending:
+        node = pending.pop(0)
+        if not isinstance(node, dict):
+            continue
+        if "stage" in node:
+            stages.append(node["stage"])
+        for key in ("queryPlan", "inputStage"):
+            if key in node:
+                pending.append(node[key])
+        pending.extend(node.get("inputStages", []))
+    return stages
+
+
+async def describe_index_plan(db) -> dict:
+    """
+    Report existing indexes and the winning plan of every hot query.
+
+    Args:
+        db: Motor database handle
+
+    Returns:
+        Dictionary with the indexes per collection and, per hot query,
+        its plan stages and whether it uses an index
+    """
+    indexes = {}
+    for collection_name in INDEX_PLAN:
+        info = await db[collection_name].index_information()
+        indexes[collection_name] = {
+            name: {"key": spec["key"], "unique": spec.get("unique", False)}
+            for name, spec in info.items()
+        }
+
+    plans = {}
+    for name, collection_name, query, sort in HOT_QUERIES:
+        cursor = db[collection_name].find(query).limit(50)
+        if sort:
+            cursor = cursor.sort(sort)
+        explain = await cursor.explain()
+        stages = _plan_stages(explain.get("queryPlanner", {}).get("winningPlan", {}))
+        plans[name] = {
+            "collection": collection_name,
+            "stages": stages,
+            "uses_index": "IXSCAN" in stages or "IDHACK" in stages or "EXPRESS_IXSCAN" in stages
+        }
+
+    return {"indexes": indexes, "plans": plans}
@@ -1,17 +1,58 @@
+import asyncio
+import hashlib
+import json
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
-from fastapi import FastAPI, HTTPException
+from typing import Optional
+from fastapi import FastAPI, Header, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
 from motor.motor_asyncio import AsyncIOMotorClient
+from pydantic import ValidationError
+from pymongo import ReturnDocument, UpdateOne
 from app.schemas import (
-    PolicyIngestRequest, TaskSchema, AuditLogSchema, TaskStatus, 
+    PolicyIngestRequest, IngestRule, TaskSchema, AuditLogSchema, TaskStatus, 
     TaskUpdateStatusRequest, TaskEscalateRequest,
-    SaveNLPResultRequest, NLPResultSchema
+    BulkTaskSelection, BulkTaskUpdateStatusRequest, BulkTaskEscalateRequest,
+    SaveNLPResultRequest, NLPResultSchema, NLPResultExportRequest, normalize_role
 )
-from app.pdf_generator import generate_policy_pdf
+from app.pdf_jobs import pdf_jobs, pdf_content_hash
+from app.export import pdf_download_name, stream_pdf_zip
+from app.nlp_storage import (
+    STORAGE_FIELDS, WITHOUT_PAYLOAD, store_nlp_data, load_nlp_data, drop_nlp_data, compute_storage_stats
+)
+from app.rendering import RenderQueueFull, render_executor
+from app.stats import compute_policy_stats, compute_single_policy_stats, compute_task_stats
+from app.counters import (
+    CounterDeltas, reset_counters, read_policy_stats, read_single_policy_stats, read_task_stats
+)
+from app.analytics import PERFORMANCE_RANGES, BucketDeltas, record_activity, read_performance
+from app.indexes import ensure_indexes, describe_index_plan
+from app.cache import ResponseCache, TTLCache
+from app.events import event_broker
+from app.storage import compute_storage_usage
+from app.metrics import LatencyMiddleware, health_sampler, health_metrics, render_prometheus, request_metrics
+from app.responses import DEFAULT_RESPONSE_CLASS, json_response
+from app.settings import (
+    EVENTS_KEEPALIVE_SECONDS, GZIP_LEVEL, GZIP_MINIMUM_SIZE,
+    RESPONSE_CACHE_MAXSIZE, RESPONSE_CACHE_TTL_SECONDS, STORAGE_STATS_TTL_SECONDS
+)
+from app.db import get_db, get_analytics_db, close as close_db, client_options, pool_metrics
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # get_db() creates the pooled client; make sure the indexes backing
+    # the hot queries exist before serving
+    await ensure_indexes(get_db())
+    health_sampler.start(get_db())
+    yield
+    await health_sampler.stop()
+    render_executor.shutdown()
+    close_db()
+
+app = FastAPI(lifespan=lifespan, default_response_class=DEFAULT_RESPONSE_CLASS)
 
 # CORS Configuration - Allow frontend to access backend
 app.add_middleware(
@@ -20,18 +61,233 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["Content-Disposition"]  # Required for PDF downloads
+    expose_headers=["Content-Disposition", "ETag"]  # Required for PDF downloads
 )
 
-from app.db import get_db
+# Compress large JSON responses; PDFs and ZIPs are already compressed
+if GZIP_MINIMUM_SIZE > 0:
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=GZIP_MINIMUM_SIZE,
+        compresslevel=GZIP_LEVEL,
+        exclude_content_types=("application/pdf", "application/zip", "text/event-stream")
+    )
+
+# Outermost, so latency includes compression and CORS handling
+app.add_middleware(LatencyMiddleware)
+
+@app.exception_handler(RenderQueueFull)
+async def render_queue_full_handler(request: Request, exc: RenderQueueFull):
+    # Backpressure: tell clients when to come back instead of queueing forever
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
 
 @app.get("/")
 def read_root():
     return {"status": "ok"}
 
+# Fields of a task document as exposed by the API
+TASK_FIELDS = list(TaskSchema.model_fields.keys())
+
+def public_task(task: dict) -> dict:
+    """Restrict a task document to the fields of TaskSchema."""
+    return {field: task.get(field) for field in TASK_FIELDS}
+
+def task_role_key(task: dict) -> str:
+    """Normalized role of a task, also for documents predating assigned_role_key."""
+    return task.get("assigned_role_key") or normalize_role(task["assigned_role"])
+
+# Results of the read-heavy dashboard endpoints, dropped on every write
+# that changes what they show
+dashboard_cache = ResponseCache("dashboard", RESPONSE_CACHE_MAXSIZE, RESPONSE_CACHE_TTL_SECONDS)
+nlp_results_cache = ResponseCache("nlp_results", RESPONSE_CACHE_MAXSIZE, RESPONSE_CACHE_TTL_SECONDS)
+# Not invalidated on writes: sizes only need to be roughly current
+storage_cache = ResponseCache("storage", 1, STORAGE_STATS_TTL_SECONDS)
+
+# Namespace of the deterministic task ids derived from (policy_id, rule_id)
+TASK_ID_NAMESPACE = uuid.UUID("5b0f4c9e-2d7a-4f61-9a3e-8c1d2b7e6f40")
+
+def task_id_for_rule(policy_id: str, rule_id: str) -> str:
+    """Deterministic task id, so re-ingesting a rule always targets the same task."""
+    return str(uuid.uuid5(TASK_ID_NAMESPACE, json.dumps([policy_id, rule_id])))
+
+def _rule_hash(rule: IngestRule, file_name: Optional[str]) -> str:
+    """Content hash of everything a rule contributes to its task."""
+    content = json.dumps([rule.action, rule.responsible_role, rule.deadline, file_name])
+    return hashlib.sha256(content.encode()).hexdigest()
+
+async def _upsert_tasks(db, policy_id: str, file_name: Optional[str], rules: list[IngestRule]) -> tuple[list[dict], dict]:
+    """
+    Idempotently write the tasks for a batch of rules.
+
+    Each rule maps to one task keyed on (policy_id, rule_id). New rules are
+    inserted, rules whose content hash changed are updated in place (the
+    task keeps its status) and unchanged rules are skipped, so re-sending a
+    policy produces no duplicate tasks and no writes for unchanged rules.
+    A changed rule only moves its task to the rule's role while the task
+    is still CREATED; escalated or started tasks keep their current role.
+
+    Returns:
+        (task documents for the rules, counts of created/updated/unchanged)
+    """
+    # If a rule_id repeats within one request the last occurrence wins
+    rules_by_id = {rule.rule_id: rule for rule in rules}
+
+    existing = {}
+    projection = {"_id": 0, "rule_hash": 1, **{field: 1 for field in TASK_FIELDS}}
+    cursor = db.tasks.find({"policy_id": policy_id, "rule_id": {"$in": list(rules_by_id)}}, projection)
+    async for document in cursor:
+        existing.setdefault(document["rule_id"], document)
+
+    tasks = {}
+    creates = []
+    planned = []
+    now = datetime.utcnow()
+
+    for rule_id, rule in rules_by_id.items():
+        content_hash = _rule_hash(rule, file_name)
+        current = existing.get(rule_id)
+        if current is not None and current.get("rule_hash") == content_hash:
+            tasks[rule_id] = current
+            continue
+
+        fields = {
+            "file_name": file_name,
+            # Normalize deadline
+            "deadline": rule.deadline if rule.deadline else "Not specified",
+            "rule_hash": content_hash
+        }
+        role_fields = {
+            "assigned_role": rule.responsible_role,
+            "assigned_role_key": normalize_role(rule.responsible_role)
+        }
+
+        if current is None:
+            creates.append({
+                "task_id": task_id_for_rule(policy_id, rule_id),
+                "policy_id": policy_id,
+                "rule_id": rule_id,
+                "task_name": f"Execute rule {rule_id}",
+                "status": TaskStatus.CREATED.value,
+                # Same instant as the TASK_CREATED audit log, for completion times
+                "created_at": now,
+                **fields,
+                **role_fields
+            })
+        elif current["status"] == TaskStatus.CREATED.value:
+            guard = {"status": current["status"], "assigned_role": current["assigned_role"]}
+            planned.append((current, guard, {**fields, **role_fields}))
+        else:
+            planned.append((current, {}, fields))
+
+    inserted = []
+    if creates:
+        # task_id comes from the upsert filter
+        result = await db.tasks.bulk_write([
+            UpdateOne(
+                {"task_id": task["task_id"]},
+                {"$setOnInsert": {k: v for k, v in task.items() if k != "task_id"}},
+                upsert=True
+            )
+            for task in creates
+        ], ordered=False)
+        # A concurrent ingest of the same rule may have inserted it first
+        inserted = [creates[index] for index in result.upserted_ids]
+    applied = await _apply_bulk_updates(db, planned)
+
+    changes = []
+    for task in creates:
+        tasks[task["rule_id"]] = task
+    for task in inserted:
+        changes.append(("TASK_CREATED", task, [task["assigned_role_key"]]))
+    for current, _, fields in planned:
+        if current["task_id"] not in applied:
+            # Escalated or otherwise changed since it was read
+            tasks[current["rule_id"]] = current
+            continue
+        task = {**current, **fields}
+        tasks[current["rule_id"]] = task
+        changes.append(("TASK_UPDATED", task, [task_role_key(current), task_role_key(task)]))
+
+    deltas = CounterDeltas()
+    audit_logs = []
+    for action, task, roles in changes:
+        if action == "TASK_CREATED":
+            deltas.add_task(task)
+        else:
+            deltas.move_task(existing[task["rule_id"]], task)
+        audit_logs.append(AuditLogSchema(
+            task_id=task["task_id"],
+            action=action,
+            performed_by_role="SYSTEM",
+            timestamp=now
+        ).model_dump())
+
+    if changes:
+        await deltas.flush(db)
+        await db.audit_logs.insert_many(audit_logs, ordered=False)
+        dashboard_cache.invalidate()
+
+    for action, task, roles in changes:
+        event_type = "task.created" if action == "TASK_CREATED" else "task.updated"
+        event_broker.publish(event_type, public_task(task), roles)
+
+    created = sum(1 for action, _, _ in changes if action == "TASK_CREATED")
+    counts = {"created": created, "updated": len(changes) - created}
+    counts["unchanged"] = len(rules_by_id) - len(changes)
+    return [tasks[rule_id] for rule_id in rules_by_id], counts
+
+async def _save_policy(db, policy_id: str, fields: dict) -> None:
+    """Upsert a policy document and count it in the policy counters and uploads."""
+    now = datetime.utcnow()
+    # Upsert so re-ingesting a policy_id respects the unique policy_id index
+    before = await db.policies.find_one_and_update(
+        {"policy_id": policy_id},
+        {"$set": fields, "$setOnInsert": {"created_at": now}},
+        projection={"_id": 0, "status": 1},
+        upsert=True,
+        return_document=ReturnDocument.BEFORE
+    )
+    deltas = CounterDeltas()
+    deltas.move_policy(before, fields)
+    await deltas.flush(db)
+    if before is None:
+        await record_activity(db, "uploads", at=now)
+    dashboard_cache.invalidate()
+
+# Idempotency-Key -> (payload fingerprint, task_ids of the response) of
+# recent ingests; only the ids are kept so large policies stay cheap to hold
+IDEMPOTENCY_TTL_SECONDS = 24 * 3600
+_ingest_responses = TTLCache(maxsize=1024, ttl=IDEMPOTENCY_TTL_SECONDS)
+
 @app.post("/policies/ingest", response_model=list[TaskSchema])
-async def ingest_policy(request: PolicyIngestRequest):
+async def ingest_policy(request: PolicyIngestRequest, idempotency_key: Optional[str] = Header(None)):
+    """
+    Ingest a parsed policy and upsert one task per rule.
+
+    Re-sending a policy is safe: tasks are keyed on (policy_id, rule_id) and
+    only new or changed rules are written. Requests carrying an
+    Idempotency-Key header that was already seen with the same payload
+    are not written again; they return the current state of the tasks of
+    the first response.
+    """
     db = get_db()
+    fingerprint = hashlib.sha256(request.model_dump_json().encode()).hexdigest()
+    if idempotency_key:
+        cached = _ingest_responses.get(idempotency_key)
+        if cached is not None:
+            cached_fingerprint, task_ids = cached
+            if cached_fingerprint != fingerprint:
+                raise HTTPException(
+                    status_code=422,
+                    detail="Idempotency-Key was already used with a different payload"
+                )
+            cursor = db.tasks.find({"task_id": {"$in": task_ids}}, {"_id": 0, **{field: 1 for field in TASK_FIELDS}})
+            by_id = {task["task_id"]: task async for task in cursor}
+            return json_response([public_task(by_id[task_id]) for task_id in task_ids if task_id in by_id])
     
     # 0. Check for Reset Flag
     if request.reset_db:
@@ -40,6 +296,12 @@ async def ingest_policy(request: PolicyIngestRequest):
         await db.tasks.delete_many({})
         await db.audit_logs.delete_many({})
         await db.nlp_results.delete_many({})
+        await db.analytics_buckets.delete_many({})
+        await drop_nlp_data(db)
+        await pdf_jobs.clear()
+        await reset_counters(db)
+        dashboard_cache.invalidate()
+        nlp_results_cache.invalidate()
         
     # 1. Save Policy
     policy_doc = request.model_dump()
@@ -48,109 +310,233 @@ async def ingest_policy(request: PolicyIngestRequest):
     if request.file_name:
         policy_doc["file_name"] = request.file_name
         
-    await db.policies.insert_one(policy_doc)
+    await _save_policy(db, request.policy_id, policy_doc)
 
-    created_tasks = []
-    audit_logs = []
+    # 2. Process Rules -> Tasks (+ 3. Audit Logs), skipping unchanged rules
+    tasks, _ = await _upsert_tasks(db, request.policy_id, request.file_name, request.rules)
+    tasks = [public_task(task) for task in tasks]
 
-    # 2. Process Rules -> Tasks
-    for rule in request.rules:
-        task_id = str(uuid.uuid4())
-        
-        # Normalize deadline
-        deadline = rule.deadline if rule.deadline else "Not specified"
+    if idempotency_key:
+        _ingest_responses.set(idempotency_key, (fingerprint, [task["task_id"] for task in tasks]))
 
-        task = TaskSchema(
-            task_id=task_id,
-            policy_id=request.policy_id,
-            file_name=request.file_name,  # Pass file_name to task
-            rule_id=rule.rule_id,
-            task_name=f"Execute rule {rule.rule_id}",
-            assigned_role=rule.responsible_role,
-            status=TaskStatus.CREATED,
-            deadline=deadline
-        )
-        created_tasks.append(task)
+    return json_response(tasks)
 
-        # 3. Create Audit Log
-        log = AuditLogSchema(
-            task_id=task_id,
-            action="TASK_CREATED",
-            performed_by_role="SYSTEM",
-            timestamp=datetime.utcnow()
-        )
-        audit_logs.append(log)
+# Rules per insert_many batch when streaming an NDJSON policy
+INGEST_BATCH_SIZE = 1000
+# Invalid lines reported back in full; further ones are only counted
+INGEST_MAX_REPORTED_ERRORS = 100
 
-    # Bulk Insert
-    if created_tasks:
-        await db.tasks.insert_many([t.model_dump() for t in created_tasks])
-    
-    if audit_logs:
-        await db.audit_logs.insert_many([l.model_dump() for l in audit_logs])
+@app.post("/policies/{policy_id}/ingest-stream")
+async def ingest_policy_stream(policy_id: str, request: Request, file_name: Optional[str] = None):
+    """
+    Ingest a very large policy as a stream of NDJSON rules.
+
+    The request body holds one IngestRule JSON object per line. Lines are
+    validated as they arrive and tasks plus audit logs are inserted in
+    batches of INGEST_BATCH_SIZE, so memory stays flat regardless of the
+    policy size and the first tasks are visible before the upload ends.
+    Like /policies/ingest it is idempotent per (policy_id, rule_id).
+    Invalid lines are skipped and reported.
+
+    Returns:
+        Summary with the number of tasks created and the rejected lines
+    """
+    db = get_db()
+
+    policy_fields = {"policy_id": policy_id, "status": "ACTIVE"}
+    if file_name:
+        policy_fields["file_name"] = file_name
+    await _save_policy(db, policy_id, policy_fields)
+    if not file_name:
+        # Re-streaming rules without a name keeps the policy's stored one
+        policy = await db.policies.find_one({"policy_id": policy_id}, {"_id": 0, "file_name": 1})
+        file_name = policy.get("file_name") if policy else None
 
-    return created_tasks
+    counts = {"created": 0, "updated": 0, "unchanged": 0}
+    batches = 0
+    invalid_lines = 0
+    errors = []
+    batch = []
+    line_number = 0
 
-@app.get("/tasks", response_model=list[TaskSchema])
-async def get_tasks(role: str = None):
+    async def flush():
+        nonlocal batches, batch
+        _, batch_counts = await _upsert_tasks(db, policy_id, file_name, batch)
+        for key, value in batch_counts.items():
+            counts[key] += value
+        batches += 1
+        batch = []
+
+    def parse(line: bytes):
+        nonlocal invalid_lines
+        if not line.strip():
+            return
+        try:
+            batch.append(IngestRule.model_validate_json(line))
+        except ValidationError as e:
+            invalid_lines += 1
+            if len(errors) < INGEST_MAX_REPORTED_ERRORS:
+                errors.append({"line": line_number, "error": e.errors(include_url=False, include_input=False)})
+
+    pending = b""
+    async for chunk in request.stream():
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            line_number += 1
+            parse(line)
+            if len(batch) >= INGEST_BATCH_SIZE:
+                await flush()
+
+    if pending:
+        line_number += 1
+        parse(pending)
+    if batch:
+        await flush()
+
+    return {
+        "policy_id": policy_id,
+        "tasks_created": counts["created"],
+        "tasks_updated": counts["updated"],
+        "tasks_unchanged": counts["unchanged"],
+        "batches": batches,
+        "invalid_lines": invalid_lines,
+        "errors": errors
+    }
+
+@app.get("/tasks")
+async def get_tasks(
+    role: Optional[str] = None,
+    status: Optional[TaskStatus] = None,
+    policy_id: Optional[str] = None,
+    after: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    fields: Optional[str] = None
+):
     """
-    Get tasks, optionally filtered by role.
+    Get a page of tasks, optionally filtered by role, status and policy.
     
     Args:
         role: Optional role filter (Admin, Officer, Clerk)
-              If not provided, returns all tasks
+              If not provided or Admin, tasks of every role are returned
+        status: Optional status filter
+        policy_id: Optional policy filter
+        after: Cursor from a previous page (the last task_id it returned)
+        limit: Maximum number of tasks in the page
+        fields: Optional comma-separated list of task fields to return
     
     Returns:
-        List of tasks (all tasks or filtered by role)
+        {"tasks": [...], "next_cursor": <task_id or null>}
+        Pass next_cursor back as `after` to fetch the following page.
     """
     db = get_db()
     query = {}
     
     # Only filter by role if role parameter is provided
     if role:
+        role_key = normalize_role(role)
         # Case-insensitive check for Admin
-        if role.lower() != "admin":
-            # Case-insensitive regex for assigned_role
-            query["assigned_role"] = {"$regex": f"^{role}$", "$options": "i"}
-        # If role is Admin, query remains empty (returns all tasks)
+        if role_key != "admin":
+            # Exact match on the indexed lowercase role key
+            query["assigned_role_key"] = role_key
+        # If role is Admin, no role filter is applied (returns all roles)
 
-    tasks = []
-    cursor = db.tasks.find(query)
-    async for document in cursor:
-        document["_id"] = str(document["_id"])
-        tasks.append(document)
+    if status:
+        query["status"] = status.value
+    if policy_id:
+        query["policy_id"] = policy_id
+    if after:
+        query["task_id"] = {"$gt": after}
+
+    projected_fields = TASK_FIELDS
+    if fields:
+        projected_fields = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = set(projected_fields) - set(TASK_FIELDS)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown task fields: {', '.join(sorted(unknown))}"
+            )
+    projection = {"_id": 0, "task_id": 1}
+    projection.update({f: 1 for f in projected_fields})
+
+    # Keyset pagination on the unique task_id; one extra document tells us
+    # whether another page exists without a separate count
+    cursor = db.tasks.find(query, projection).sort("task_id", 1).limit(limit + 1)
+    tasks = await cursor.to_list(length=limit + 1)
+
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = tasks[-1]["task_id"]
     
-    return tasks
+    return json_response({"tasks": tasks, "next_cursor": next_cursor})
+
+@app.get("/tasks/stats")
+async def get_task_stats(role: Optional[str] = None):
+    """
+    Get task counts per status for the dashboard cards
+
+    Counts every task, not just one page of /tasks. Read from the global
+    or role:<role_key> stats_counters; falls back to aggregating the tasks
+    until the counters have been reconciled (python -m app.counters).
+
+    Args:
+        role: Optional role filter; Admin or no role counts every task
+    """
+    role_key = normalize_role(role) if role else None
+    if role_key == "admin":
+        role_key = None
+    db = get_analytics_db()
+
+    async def load():
+        return await read_task_stats(db, role_key) or await compute_task_stats(db, role_key)
+
+    return await dashboard_cache.get_or_compute(("task-stats", role_key), load)
+
+# Allowed status moves: current status -> statuses it may move to
+VALID_TRANSITIONS = {
+    "CREATED": ["ASSIGNED"],
+    "ASSIGNED": ["IN_PROGRESS"],
+    "IN_PROGRESS": ["COMPLETED", "ESCALATED"],
+    "COMPLETED": [],
+    "ESCALATED": []
+}
+
+# Escalation hierarchy keyed by normalized role: current role -> next role
+ESCALATION_PATH = {
+    "clerk": "Officer",
+    "officer": "Admin"
+}
 
 @app.post("/tasks/{task_id}/update-status", response_model=TaskSchema)
 async def update_task_status(task_id: str, request: TaskUpdateStatusRequest):
-    from fastapi import HTTPException
     db = get_db()
+    new_status = request.new_status.value
 
-    task = await db.tasks.find_one({"task_id": task_id})
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    current_status = task["status"]
-    new_status = request.new_status
-
-    valid_transitions = {
-        "CREATED": ["ASSIGNED"],
-        "ASSIGNED": ["IN_PROGRESS"],
-        "IN_PROGRESS": ["COMPLETED", "ESCALATED"],
-        "COMPLETED": [],
-        "ESCALATED": []
-    }
+    # The transition check and the write happen in one conditional update,
+    # so two concurrent requests cannot both pass the valid_transitions check
+    allowed_from = [
+        status for status, targets in VALID_TRANSITIONS.items() if new_status in targets
+    ]
+    task = await db.tasks.find_one_and_update(
+        {"task_id": task_id, "status": {"$in": allowed_from}},
+        {"$set": {"status": new_status}},
+        projection={"_id": 0},
+        return_document=ReturnDocument.BEFORE
+    )
 
-    if new_status not in valid_transitions.get(current_status, []):
+    if not task:
+        # Slow path, only to report why the update did not apply
+        current = await db.tasks.find_one({"task_id": task_id}, {"status": 1})
+        if not current:
+            raise HTTPException(status_code=404, detail="Task not found")
         raise HTTPException(
             status_code=400, 
-            detail=f"Invalid transition from {current_status} to {new_status}"
+            detail=f"Invalid transition from {current['status']} to {new_status}"
         )
 
-    await db.tasks.update_one(
-        {"task_id": task_id},
-        {"$set": {"status": new_status}}
-    )
+    current_status = task["status"]
     
     log = AuditLogSchema(
         task_id=task_id,
@@ -160,45 +546,64 @@ async def update_task_status(task_id: str, request: TaskUpdateStatusRequest):
     )
     await db.audit_logs.insert_one(log.model_dump())
 
-    updated_task = await db.tasks.find_one({"task_id": task_id})
-    updated_task["_id"] = str(updated_task["_id"])
-    return updated_task
+    deltas = CounterDeltas()
+    deltas.move_task(task, {**task, "status": new_status})
+    if new_status == TaskStatus.COMPLETED.value:
+        deltas.add_completion(task, log.timestamp)
+        await record_activity(db, "processed", at=log.timestamp)
+    await deltas.flush(db)
+    dashboard_cache.invalidate()
+
+    # The pre-image plus the fields we set is exactly the updated document
+    task["status"] = new_status
+    event_broker.publish(
+        "task.status_changed", public_task(task), [task_role_key(task)], previous_status=current_status
+    )
+    return json_response(public_task(task))
+
+# Server-side task_role_key(): the stored key, or the normalized role for
+# tasks written before assigned_role_key existed (same as the migration)
+ROLE_KEY_EXPRESSION = {"$ifNull": ["$assigned_role_key", {"$toLower": {"$trim": {"input": "$assigned_role"}}}]}
+
+def _escalated_role_expression(field: str, to_value) -> dict:
+    """Build a $switch mapping the task's role key to its escalated value."""
+    return {"$switch": {
+        "branches": [
+            {"case": {"$eq": [ROLE_KEY_EXPRESSION, role_key]}, "then": to_value(next_role)}
+            for role_key, next_role in ESCALATION_PATH.items()
+        ],
+        "default": f"${field}"
+    }}
 
 @app.post("/tasks/{task_id}/escalate", response_model=TaskSchema)
 async def escalate_task(task_id: str, request: TaskEscalateRequest):
-    from fastapi import HTTPException
     db = get_db()
 
-    task = await db.tasks.find_one({"task_id": task_id})
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+    # Pick the next role server-side so the check and the write are atomic
+    task = await db.tasks.find_one_and_update(
+        {"task_id": task_id, "$expr": {"$in": [ROLE_KEY_EXPRESSION, list(ESCALATION_PATH)]}},
+        [{"$set": {
+            "assigned_role": _escalated_role_expression("assigned_role", lambda role: role),
+            "assigned_role_key": _escalated_role_expression("assigned_role_key", normalize_role),
+            "status": "ESCALATED"
+        }}],
+        projection={"_id": 0},
+        return_document=ReturnDocument.BEFORE
+    )
 
-    current_role = task["assigned_role"]
-    
-    escalation_path = {
-        "Clerk": "Officer",
-        "Officer": "Admin"
-    }
-    
-    next_role = None
-    for role_key, role_val in escalation_path.items():
-        if role_key.lower() == current_role.lower():
-            next_role = role_val
-            break
-    
-    if not next_role:
+    if not task:
+        # Slow path, only to report why the escalation did not apply
+        current = await db.tasks.find_one({"task_id": task_id}, {"assigned_role": 1})
+        if not current:
+            raise HTTPException(status_code=404, detail="Task not found")
         raise HTTPException(
             status_code=400, 
-            detail=f"Cannot escalate from {current_role}. Already at highest level or invalid role."
+            detail=f"Cannot escalate from {current['assigned_role']}. Already at highest level or invalid role."
         )
 
-    await db.tasks.update_one(
-        {"task_id": task_id},
-        {"$set": {
-            "assigned_role": next_role,
-            "status": "ESCALATED"
-        }}
-    )
+    current_role = task["assigned_role"]
+    previous_role_key = task_role_key(task)
+    next_role = ESCALATION_PATH[previous_role_key]
     
     log = AuditLogSchema(
         task_id=task_id,
@@ -208,9 +613,255 @@ async def escalate_task(task_id: str, request: TaskEscalateRequest):
     )
     await db.audit_logs.insert_one(log.model_dump())
 
-    updated_task = await db.tasks.find_one({"task_id": task_id})
-    updated_task["_id"] = str(updated_task["_id"])
-    return updated_task
+    # The pre-image plus the fields we set is exactly the updated document
+    before = dict(task)
+    task.update({
+        "assigned_role": next_role,
+        "assigned_role_key": normalize_role(next_role),
+        "status": "ESCALATED"
+    })
+    deltas = CounterDeltas()
+    deltas.move_task(before, task)
+    await deltas.flush(db)
+    dashboard_cache.invalidate()
+    event_broker.publish(
+        "task.escalated", public_task(task), [previous_role_key, task["assigned_role_key"]],
+        previous_role=current_role
+    )
+    return json_response(public_task(task))
+
+# Upper bound on the tasks one bulk request may touch
+BULK_MAX_TASKS = 5000
+
+async def _select_bulk_tasks(db, selection: BulkTaskSelection) -> tuple[list[dict], list[str]]:
+    """
+    Resolve a bulk selection to task documents with a single query.
+
+    Returns:
+        (matching tasks, requested task_ids that do not exist)
+    """
+    query = {}
+    if selection.task_ids is not None:
+        if len(selection.task_ids) > BULK_MAX_TASKS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {BULK_MAX_TASKS} task_ids per bulk request"
+            )
+        query["task_id"] = {"$in": selection.task_ids}
+    if selection.policy_id:
+        query["policy_id"] = selection.policy_id
+    if selection.status:
+        query["status"] = selection.status.value
+    if selection.assigned_role:
+        query["assigned_role_key"] = normalize_role(selection.assigned_role)
+
+    if not query:
+        raise HTTPException(
+            status_code=400,
+            detail="Provide task_ids or at least one of policy_id, status, assigned_role"
+        )
+
+    # Full task fields, so change events carry the updated task
+    projection = {"_id": 0, "assigned_role_key": 1, "created_at": 1, **{field: 1 for field in TASK_FIELDS}}
+    cursor = db.tasks.find(query, projection).limit(BULK_MAX_TASKS + 1)
+    tasks = await cursor.to_list(length=BULK_MAX_TASKS + 1)
+    if len(tasks) > BULK_MAX_TASKS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Selection matches more than {BULK_MAX_TASKS} tasks; narrow the filter"
+        )
+
+    missing = []
+    if selection.task_ids is not None:
+        found = {task["task_id"] for task in tasks}
+        missing = [task_id for task_id in selection.task_ids if task_id not in found]
+    return tasks, missing
+
+async def _apply_bulk_updates(db, planned: list[tuple[dict, dict, dict]]) -> set[str]:
+    """
+    Run the planned conditional updates in one unordered bulk_write.
+
+    Every update is guarded by the state it was planned from and also sets
+    last_op to a token unique to this request. If fewer documents matched
+    than were planned, another request changed some of them in between;
+    only tasks carrying the token were updated by this request. Checking
+    the resulting state instead would also accept tasks that a concurrent
+    request moved to the same state first. The token is unset again once
+    the writes are confirmed, so it does not stay in the task documents.
+
+    Args:
+        planned: (task, guard filter, fields to $set) per task
+
+    Returns:
+        task_ids whose update applied
+    """
+    if not planned:
+        return set()
+
+    op_id = str(uuid.uuid4())
+    operations = [
+        UpdateOne({"task_id": task["task_id"], **guard}, {"$set": {**fields, "last_op": op_id}})
+        for task, guard, fields in planned
+    ]
+    result = await db.tasks.bulk_write(operations, ordered=False)
+    task_ids = [task["task_id"] for task, _, _ in planned]
+    if result.matched_count == len(planned):
+        applied = set(task_ids)
+    else:
+        cursor = db.tasks.find({"task_id": {"$in": task_ids}, "last_op": op_id}, {"_id": 0, "task_id": 1})
+        applied = {current["task_id"] async for current in cursor}
+
+    if applied:
+        await db.tasks.update_many(
+            {"task_id": {"$in": list(applied)}, "last_op": op_id}, {"$unset": {"last_op": ""}}
+        )
+    return applied
+
+def _bulk_response(results: list[dict]) -> dict:
+    succeeded = sum(1 for r in results if r["success"])
+    return {
+        "requested": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results
+    }
+
+@app.post("/tasks/bulk-update-status")
+async def bulk_update_task_status(request: BulkTaskUpdateStatusRequest):
+    """
+    Apply one status transition to many tasks at once
+
+    Tasks are selected by task_ids and/or policy_id/status/assigned_role
+    filters. The valid_transitions rules are applied per task, all updates
+    go out in one bulk_write and all audit logs in one insert_many.
+
+    Returns:
+        Summary counts plus a per-task success or failure entry
+    """
+    db = get_db()
+    new_status = request.new_status.value
+    tasks, missing = await _select_bulk_tasks(db, request)
+
+    results = {task_id: {"task_id": task_id, "success": False, "detail": "Task not found"}
+               for task_id in missing}
+    planned = []
+    for task in tasks:
+        current_status = task["status"]
+        if new_status not in VALID_TRANSITIONS.get(current_status, []):
+            results[task["task_id"]] = {
+                "task_id": task["task_id"],
+                "success": False,
+                "detail": f"Invalid transition from {current_status} to {new_status}"
+            }
+            continue
+        planned.append((task, {"status": current_status}, {"status": new_status}))
+
+    applied = await _apply_bulk_updates(db, planned)
+
+    audit_logs = []
+    deltas = CounterDeltas()
+    buckets = BucketDeltas()
+    now = datetime.utcnow()
+    for task, _, _ in planned:
+        task_id = task["task_id"]
+        if task_id not in applied:
+            results[task_id] = {"task_id": task_id, "success": False, "detail": "Task changed concurrently"}
+            continue
+        results[task_id] = {"task_id": task_id, "success": True, "status": new_status}
+        deltas.move_task(task, {**task, "status": new_status})
+        if new_status == TaskStatus.COMPLETED.value:
+            deltas.add_completion(task, now)
+            buckets.add("processed", now)
+        audit_logs.append(AuditLogSchema(
+            task_id=task_id,
+            action=f"STATUS_UPDATE: {task['status']} -> {new_status}",
+            performed_by_role=request.role,
+            timestamp=now
+        ).model_dump())
+        event_broker.publish(
+            "task.status_changed", public_task({**task, "status": new_status}),
+            [task_role_key(task)], previous_status=task["status"]
+        )
+
+    if audit_logs:
+        await db.audit_logs.insert_many(audit_logs)
+        await deltas.flush(db)
+        await buckets.flush(db)
+        dashboard_cache.invalidate()
+
+    order = request.task_ids if request.task_ids is not None else [t["task_id"] for t in tasks]
+    return _bulk_response([results[task_id] for task_id in dict.fromkeys(order)])
+
+@app.post("/tasks/bulk-escalate")
+async def bulk_escalate_tasks(request: BulkTaskEscalateRequest):
+    """
+    Escalate many tasks one level up the escalation path at once
+
+    Tasks are selected like /tasks/bulk-update-status. Updates go out in one
+    bulk_write and all audit logs in one insert_many.
+
+    Returns:
+        Summary counts plus a per-task success or failure entry
+    """
+    db = get_db()
+    tasks, missing = await _select_bulk_tasks(db, request)
+
+    results = {task_id: {"task_id": task_id, "success": False, "detail": "Task not found"}
+               for task_id in missing}
+    planned = []
+    next_roles = {}
+    for task in tasks:
+        current_role = task["assigned_role"]
+        current_role_key = task_role_key(task)
+        next_role = ESCALATION_PATH.get(current_role_key)
+        if not next_role:
+            results[task["task_id"]] = {
+                "task_id": task["task_id"],
+                "success": False,
+                "detail": f"Cannot escalate from {current_role}. Already at highest level or invalid role."
+            }
+            continue
+        next_roles[task["task_id"]] = next_role
+        # A concurrent transition leaves the role as is, so guard the status too
+        planned.append((task, {"assigned_role": current_role, "status": task["status"]}, {
+            "assigned_role": next_role,
+            "assigned_role_key": normalize_role(next_role),
+            "status": "ESCALATED"
+        }))
+
+    applied = await _apply_bulk_updates(db, planned)
+
+    audit_logs = []
+    deltas = CounterDeltas()
+    now = datetime.utcnow()
+    for task, _, _ in planned:
+        task_id = task["task_id"]
+        next_role = next_roles[task_id]
+        if task_id not in applied:
+            results[task_id] = {"task_id": task_id, "success": False, "detail": "Task changed concurrently"}
+            continue
+        results[task_id] = {"task_id": task_id, "success": True, "assigned_role": next_role}
+        deltas.move_task(task, {**task, "assigned_role": next_role, "status": "ESCALATED"})
+        audit_logs.append(AuditLogSchema(
+            task_id=task_id,
+            action=f"ESCALATION: {task['assigned_role']} -> {next_role}",
+            performed_by_role=request.role,
+            timestamp=now
+        ).model_dump())
+        event_broker.publish(
+            "task.escalated",
+            public_task({**task, "assigned_role": next_role, "status": "ESCALATED"}),
+            [task_role_key(task), normalize_role(next_role)],
+            previous_role=task["assigned_role"]
+        )
+
+    if audit_logs:
+        await db.audit_logs.insert_many(audit_logs)
+        await deltas.flush(db)
+        dashboard_cache.invalidate()
+
+    order = request.task_ids if request.task_ids is not None else [t["task_id"] for t in tasks]
+    return _bulk_response([results[task_id] for task_id in dict.fromkeys(order)])
 
 @app.get("/audit-logs")
 async def get_audit_logs(limit: int = 50):
@@ -218,8 +869,11 @@ async def get_audit_logs(limit: int = 50):
     Get audit trail of all task actions
     Returns logs in reverse chronological order (newest first)
     """
-    db = get_db()
-    
+    db = get_analytics_db()
+    logs = await dashboard_cache.get_or_compute(("audit-logs", limit), lambda: _load_audit_logs(db, limit))
+    return json_response(logs)
+
+async def _load_audit_logs(db, limit: int) -> list[dict]:
     logs = []
     cursor = db.audit_logs.find().sort("timestamp", -1).limit(limit)
     
@@ -237,9 +891,12 @@ async def get_recent_activity(limit: int = 20):
     """
     Get recent system activity for timeline display
     """
-    from datetime import datetime, timedelta
-    db = get_db()
-    
+    db = get_analytics_db()
+    return await dashboard_cache.get_or_compute(
+        ("activity", limit), lambda: _load_recent_activity(db, limit)
+    )
+
+async def _load_recent_activity(db, limit: int) -> list[dict]:
     activities = []
     
     # Get recent audit logs and convert to activities
@@ -291,37 +948,82 @@ async def get_recent_activity(limit: int = 20):
     
     return activities
 
+# Real-time Events
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+@app.websocket("/ws/events")
+async def task_events_ws(websocket: WebSocket, role: Optional[str] = None):
+    """
+    Push task changes over a WebSocket as they happen
+
+    Each message is a JSON event: task.created, task.updated,
+    task.status_changed or task.escalated with the updated task, or
+    "resync" when the client fell behind and should refetch. With a role
+    (other than Admin) only events touching that role are sent.
+    """
+    await websocket.accept()
+    subscription = event_broker.subscribe(role)
+    disconnected = asyncio.create_task(_wait_for_disconnect(websocket))
+    try:
+        while True:
+            next_event = asyncio.ensure_future(subscription.get())
+            await asyncio.wait({next_event, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected.done():
+                next_event.cancel()
+                break
+            await websocket.send_text(json.dumps(next_event.result(), default=str))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        disconnected.cancel()
+        event_broker.unsubscribe(subscription)
+
+@app.get("/events")
+async def task_events_sse(role: Optional[str] = None):
+    """
+    Push task changes as Server-Sent Events
+
+    Same events and role filtering as /ws/events; a comment line is sent
+    every EVENTS_KEEPALIVE_SECONDS to keep idle connections open.
+    """
+    subscription = event_broker.subscribe(role)
+
+    async def stream():
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.get(), EVENTS_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+        finally:
+            event_broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/policies/stats")
 async def get_policy_stats():
     """
     Get policy and task statistics for dashboard metrics
+
+    Served from the incrementally maintained stats_counters in a single
+    read; falls back to aggregating the collections until the counters
+    have been reconciled (python -m app.counters).
     """
-    db = get_db()
-    
-    # Count policies
-    total_policies = await db.policies.count_documents({})
-    active_policies = await db.policies.count_documents({"status": "ACTIVE"})
-    
-    # Count tasks by status
-    total_tasks = await db.tasks.count_documents({})
-    created_tasks = await db.tasks.count_documents({"status": "CREATED"})
-    assigned_tasks = await db.tasks.count_documents({"status": "ASSIGNED"})
-    in_progress_tasks = await db.tasks.count_documents({"status": "IN_PROGRESS"})
-    completed_tasks = await db.tasks.count_documents({"status": "COMPLETED"})
-    escalated_tasks = await db.tasks.count_documents({"status": "ESCALATED"})
-    
-    return {
-        "total_policies": total_policies,
-        "active_policies": active_policies,
-        "completed_policies": 0,  # Can be calculated based on all tasks completed
-        "pending_policies": total_policies - active_policies,
-        "total_tasks": total_tasks,
-        "created_tasks": created_tasks,
-        "assigned_tasks": assigned_tasks,
-        "in_progress_tasks": in_progress_tasks,
-        "completed_tasks": completed_tasks,
-        "escalated_tasks": escalated_tasks
-    }
+    db = get_analytics_db()
+
+    async def load():
+        return await read_policy_stats(db) or await compute_policy_stats(db)
+
+    return await dashboard_cache.get_or_compute("policy-stats", load)
 
 @app.get("/policies/stats/{policy_id}")
 async def get_single_policy_stats(policy_id: str):
@@ -330,98 +1032,104 @@ async def get_single_policy_stats(policy_id: str):
     """
     db = get_db()
     
-    # Verify policy exists
-    policy = await db.policies.find_one({"policy_id": policy_id})
+    # Verify policy exists, on the primary so a just-ingested policy is found
+    policy = await db.policies.find_one({"policy_id": policy_id}, {"_id": 1})
     if not policy:
         raise HTTPException(status_code=404, detail="Policy not found")
 
-    # Get all tasks for this policy
-    tasks_cursor = db.tasks.find({"policy_id": policy_id})
-    tasks = await tasks_cursor.to_list(length=None)
-    
-    total_tasks = len(tasks)
-    
-    # Initialize counters
-    tasks_by_status = {
-        "CREATED": 0,
-        "ASSIGNED": 0,
-        "IN_PROGRESS": 0,
-        "COMPLETED": 0,
-        "ESCALATED": 0
-    }
-    
-    tasks_by_role = {}
-    
-    # Aggregate counts
-    for task in tasks:
-        # Status counts
-        status = task.get("status", "CREATED")
-        tasks_by_status[status] = tasks_by_status.get(status, 0) + 1
-        
-        # Role counts
-        role = task.get("assigned_role", "Unknown")
-        tasks_by_role[role] = tasks_by_role.get(role, 0) + 1
-        
-    # Calculate completion rate
-    completion_rate = 0
-    if total_tasks > 0:
-        completed = tasks_by_status.get("COMPLETED", 0)
-        completion_rate = int((completed / total_tasks) * 100)
-        
-    return {
-        "policy_id": policy_id,
-        "total_tasks": total_tasks,
-        "tasks_by_status": tasks_by_status,
-        "tasks_by_role": tasks_by_role,
-        "completion_rate_percent": completion_rate,
-        "average_completion_time_hours": 0  # Placeholder for future implementation
-    }
+    # The statistics themselves may lag slightly behind
+    analytics_db = get_analytics_db()
+    return (
+        await read_single_policy_stats(analytics_db, policy_id)
+        or await compute_single_policy_stats(analytics_db, policy_id)
+    )
 
 @app.get("/analytics/performance")
-async def get_performance_stats():
+async def get_performance_stats(range: str = "7d"):
     """
-    Get performance statistics for the dashboard chart (Mock Data)
+    Get uploads/processed/exported series for the dashboard chart
+
+    Read from the pre-aggregated analytics_buckets: hourly buckets for 24h,
+    daily buckets for 7d and 30d, and daily buckets summed per month for
+    365d, so a range costs at most a few hundred small documents.
+
+    Args:
+        range: 24h, 7d, 30d or 365d
     """
-    return {
-        "range": "7d",
-        "data": [
-            { "name": "Mon", "uploads": 10, "processed": 8, "exported": 5 },
-            { "name": "Tue", "uploads": 15, "processed": 12, "exported": 10 },
-            { "name": "Wed", "uploads": 8, "processed": 7, "exported": 6 },
-            { "name": "Thu", "uploads": 20, "processed": 18, "exported": 15 },
-            { "name": "Fri", "uploads": 12, "processed": 10, "exported": 8 },
-            { "name": "Sat", "uploads": 5, "processed": 5, "exported": 2 },
-            { "name": "Sun", "uploads": 3, "processed": 3, "exported": 1 }
-        ]
-    }
+    if range not in PERFORMANCE_RANGES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown range {range}; use one of {', '.join(PERFORMANCE_RANGES)}"
+        )
+    db = get_analytics_db()
+    return await dashboard_cache.get_or_compute(("performance", range), lambda: read_performance(db, range))
 
 @app.get("/system/storage")
 async def get_storage_stats():
     """
-    Get storage usage statistics (Mock Data)
+    Get storage usage statistics
+
+    Computed from collStats and dbStats and cached for
+    STORAGE_STATS_TTL_SECONDS. Per collection it reports document counts,
+    data, storage and index sizes and the average document size; alerts
+    lists nlp_results and audit_logs growth past the capacity thresholds.
     """
-    return {
-        "total_storage_gb": 100,
-        "used_storage_gb": 45.5,
-        "available_gb": 54.5,
-        "breakdown": [
-            { "name": "Documents", "value": 30, "color": "#00FFFF" },
-            { "name": "Processed Data", "value": 15.5, "color": "#8A2BE2" }
-        ]
-    }
+    db = get_db()
+    return await storage_cache.get_or_compute("storage", lambda: compute_storage_usage(db))
 
 @app.get("/system/health")
 async def get_system_health():
     """
-    Get system health metrics (Mock Data)
+    Get system health metrics measured by this worker
+
+    Database is the share of successful background pings over the last
+    hour and Database Latency the last ping; API Latency is the p95 and
+    Event Loop Lag the p99 of the last minute or so. routes lists request
+    counts, error rates and latency percentiles per endpoint. pdf reports
+    the render pool's queue depth and the stored PDF cache size.
     """
     return {
-        "metrics": [
-            { "name": "Database", "status": "healthy", "value": "99.9%", "icon": "CircleStackIcon" },
-            { "name": "API Latency", "status": "healthy", "value": "120ms", "icon": "ClockIcon" }
-        ]
+        "metrics": health_metrics(),
+        "routes": request_metrics.summary(),
+        "pdf": {"executor": render_executor.stats(), "cache": pdf_jobs.stats()}
     }
 
+@app.get("/metrics")
+async def get_prometheus_metrics():
+    """
+    Get request, MongoDB ping and event-loop metrics in Prometheus text format
+    """
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+@app.get("/admin/cache")
+async def get_cache_stats():
+    """
+    Get hit/miss metrics of the in-process response caches
+
+    Counts are per worker process and reset on restart.
+    """
+    return {"caches": [dashboard_cache.stats(), nlp_results_cache.stats(), storage_cache.stats()]}
+
+@app.get("/admin/db-pool")
+async def get_db_pool_stats():
+    """
+    Get MongoDB client settings and connection pool utilization
+
+    Counters come from pymongo pool events and are per worker process.
+    """
+    return {"options": client_options(), **pool_metrics.snapshot()}
+
+@app.get("/admin/indexes")
+async def get_index_plan():
+    """
+    Get the index plan and the query plan of every hot endpoint query
+
+    Each hot query is run through explain() so operators can confirm it is
+    served by an IXSCAN instead of a COLLSCAN.
+    """
+    db = get_db()
+    return await describe_index_plan(db)
+
 # NLP Results Endpoints
 
 @app.post("/nlp-results/save")
@@ -430,7 +1138,8 @@ async def save_nlp_result(request: SaveNLPResultRequest):
     Save NLP processing results to database
     
     This endpoint stores the complete NLP output including all extracted rules
-    and metadata for later retrieval and PDF generation.
+    and metadata for later retrieval and PDF generation. nlp_data is stored
+    compressed, in GridFS when it is large, with a small summary inline.
     """
     db = get_db()
     
@@ -441,42 +1150,95 @@ async def save_nlp_result(request: SaveNLPResultRequest):
         "policy_id": request.policy_id,
         "file_name": request.file_name,
         "upload_timestamp": datetime.utcnow(),
-        "nlp_data": request.nlp_data,
         "status": "completed"
     }
+    nlp_result.update(await store_nlp_data(db, result_id, request.nlp_data))
     
     await db.nlp_results.insert_one(nlp_result)
+    nlp_results_cache.invalidate()
     
     return {
         "result_id": result_id,
         "message": "NLP results saved successfully"
     }
 
+# Summary fields returned by the NLP results list; nlp_data is never read
+NLP_RESULT_SUMMARY_FIELDS = ["result_id", "policy_id", "file_name", "upload_timestamp", "status"]
+
+def _parse_nlp_results_cursor(after: str) -> tuple[datetime, str]:
+    """Split an "<upload_timestamp>|<result_id>" cursor into its keys."""
+    timestamp, _, result_id = after.partition("|")
+    try:
+        return datetime.fromisoformat(timestamp), result_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @app.get("/nlp-results")
-async def get_nlp_results():
+async def get_nlp_results(
+    after: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500)
+):
     """
-    Get list of all NLP processing results
+    Get a page of NLP processing results, newest first
     
-    Returns metadata for all stored NLP results without the full data payload.
+    Returns metadata only; the nlp_data payload is excluded by the
+    projection, so it never leaves the database.
+
+    Args:
+        after: Cursor from a previous page
+        limit: Maximum number of results in the page
+
+    Returns:
+        {"results": [...], "next_cursor": <cursor or null>}
+        Pass next_cursor back as `after` to fetch the following page.
+    """
+    db = get_analytics_db()
+
+    query = {}
+    if after:
+        timestamp, result_id = _parse_nlp_results_cursor(after)
+        query["$or"] = [
+            {"upload_timestamp": {"$lt": timestamp}},
+            {"upload_timestamp": timestamp, "result_id": {"$lt": result_id}}
+        ]
+
+    page = await nlp_results_cache.get_or_compute(
+        ("page", after, limit), lambda: _load_nlp_results_page(db, query, limit)
+    )
+    return json_response(page)
+
+async def _load_nlp_results_page(db, query: dict, limit: int) -> dict:
+    projection = {"_id": 0}
+    projection.update({f: 1 for f in NLP_RESULT_SUMMARY_FIELDS})
+
+    # Keyset pagination on (upload_timestamp, result_id), backed by the
+    # upload_timestamp_result_id index; one extra document signals a next page
+    cursor = db.nlp_results.find(query, projection).sort(
+        [("upload_timestamp", -1), ("result_id", -1)]
+    ).limit(limit + 1)
+    results = await cursor.to_list(length=limit + 1)
+
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        last = results[-1]
+        next_cursor = f"{last['upload_timestamp'].isoformat()}|{last['result_id']}"
+
+    for result in results:
+        result["upload_timestamp"] = result["upload_timestamp"].isoformat()
+
+    return {"results": results, "next_cursor": next_cursor}
+
+@app.get("/nlp-results/storage-stats")
+async def get_nlp_storage_stats():
+    """
+    Get storage footprint of NLP result payloads
+
+    Reports raw and stored (compressed) bytes with the compression ratio,
+    overall and per storage kind (inline or GridFS).
     """
     db = get_db()
-    
-    results = []
-    cursor = db.nlp_results.find().sort("upload_timestamp", -1)
-    
-    async for document in cursor:
-        document["_id"] = str(document["_id"])
-        # Don't include full nlp_data in list view
-        result_summary = {
-            "result_id": document["result_id"],
-            "policy_id": document["policy_id"],
-            "file_name": document["file_name"],
-            "upload_timestamp": document["upload_timestamp"].isoformat(),
-            "status": document["status"]
-        }
-        results.append(result_summary)
-    
-    return results
+    return await compute_storage_stats(db)
 
 @app.get("/nlp-results/{result_id}")
 async def get_nlp_result(result_id: str):
@@ -492,48 +1254,153 @@ async def get_nlp_result(result_id: str):
     if not result:
         raise HTTPException(status_code=404, detail="NLP result not found")
     
+    try:
+        nlp_data = await load_nlp_data(db, result)
+    except LookupError:
+        raise HTTPException(status_code=404, detail="NLP result not found")
+    for field in STORAGE_FIELDS:
+        result.pop(field, None)
+
     result["_id"] = str(result["_id"])
     result["upload_timestamp"] = result["upload_timestamp"].isoformat()
+    result["nlp_data"] = nlp_data
     
-    return result
+    return json_response(result)
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header covers the given (quoted) ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+@app.post("/nlp-results/{result_id}/pdf-jobs", status_code=202)
+async def create_pdf_job(result_id: str):
+    """
+    Queue background rendering of an NLP result's PDF
+
+    Rendering runs on a process pool and the finished PDF is stored on disk,
+    keyed by result_id and content hash. Poll /pdf-jobs/{job_id} for progress,
+    then fetch the PDF from /nlp-results/{result_id}/download-pdf.
+    """
+    db = get_db()
+
+    result = await db.nlp_results.find_one({"result_id": result_id}, WITHOUT_PAYLOAD)
+    if not result:
+        raise HTTPException(status_code=404, detail="NLP result not found")
+
+    job = pdf_jobs.submit(result)
+    return {**job, "status_url": f"/pdf-jobs/{job['job_id']}"}
+
+@app.get("/pdf-jobs/{job_id}")
+async def get_pdf_job(job_id: str):
+    """
+    Get status and progress of a PDF rendering job
+    """
+    job = pdf_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="PDF job not found")
+
+    response = dict(job)
+    if job["status"] == "completed":
+        response["download_url"] = f"/nlp-results/{job['result_id']}/download-pdf"
+    return response
 
 @app.get("/nlp-results/{result_id}/download-pdf")
-async def download_pdf(result_id: str):
+async def download_pdf(result_id: str, if_none_match: Optional[str] = Header(None)):
     """
     Download PDF of NLP results
     
-    Generates and returns a formatted PDF document containing the policy rules
-    and metadata extracted by the NLP system.
+    Returns a formatted PDF document containing the policy rules and
+    metadata extracted by the NLP system. The PDF is rendered once per
+    content hash and then streamed from storage; the hash doubles as the
+    ETag, so clients revalidating with If-None-Match get a 304.
     """
     db = get_db()
     
-    # Fetch NLP result from database
-    result = await db.nlp_results.find_one({"result_id": result_id})
+    # Fetch NLP result metadata; the payload is only read if a render is needed
+    result = await db.nlp_results.find_one({"result_id": result_id}, WITHOUT_PAYLOAD)
     
     if not result:
         raise HTTPException(status_code=404, detail="NLP result not found")
+
+    etag = f'"{pdf_content_hash(result)}"'
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
     
-    # Generate PDF
+    # Render (or reuse) the PDF
     try:
-        pdf_buffer = generate_policy_pdf(
-            nlp_data=result["nlp_data"],
-            file_name=result["file_name"]
-        )
-        
-        # Create filename
-        safe_policy_id = result["policy_id"].replace("/", "_").replace("\\", "_")
-        filename = f"policy_{safe_policy_id}.pdf"
-        
-        # Return PDF as streaming response
-        return StreamingResponse(
-            pdf_buffer,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"'
-            }
-        )
+        pdf_path, _ = await pdf_jobs.ensure_artifact(result)
+    except RenderQueueFull:
+        raise
+    except LookupError:
+        # Deleted while the PDF was being prepared
+        raise HTTPException(status_code=404, detail="NLP result not found")
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error generating PDF: {str(e)}"
         )
+
+    await record_activity(db, "exported")
+    dashboard_cache.invalidate()
+
+    # Stream the stored PDF
+    return FileResponse(
+        pdf_path,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="{pdf_download_name(result)}"',
+            "ETag": etag
+        }
+    )
+
+EXPORT_MAX_RESULTS = 200
+
+@app.post("/nlp-results/export")
+async def export_nlp_results(request: NLPResultExportRequest):
+    """
+    Export many NLP result PDFs as one ZIP archive
+
+    Results are selected by result_ids and/or an upload_timestamp range and
+    fetched in a single query. PDFs render in parallel on the render
+    executor (reusing stored artifacts) and each one is streamed into the
+    archive as soon as it is ready. manifest.json inside the archive lists
+    exported, missing and failed results.
+    """
+    db = get_db()
+
+    query = {}
+    if request.result_ids is not None:
+        query["result_id"] = {"$in": request.result_ids}
+    if request.uploaded_from or request.uploaded_to:
+        query["upload_timestamp"] = {}
+        if request.uploaded_from:
+            query["upload_timestamp"]["$gte"] = request.uploaded_from
+        if request.uploaded_to:
+            query["upload_timestamp"]["$lte"] = request.uploaded_to
+    if not query:
+        raise HTTPException(status_code=400, detail="Provide result_ids and/or an upload date range")
+
+    results = await db.nlp_results.find(query, WITHOUT_PAYLOAD).sort("upload_timestamp", 1).to_list(EXPORT_MAX_RESULTS + 1)
+    if len(results) > EXPORT_MAX_RESULTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Export matches more than {EXPORT_MAX_RESULTS} results; narrow the selection"
+        )
+    if not results:
+        raise HTTPException(status_code=404, detail="No NLP results matched the export")
+
+    found = {result["result_id"] for result in results}
+    missing = [result_id for result_id in request.result_ids or [] if result_id not in found]
+
+    async def count_exports(manifest: dict):
+        await record_activity(db, "exported", len(manifest["exported"]))
+        dashboard_cache.invalidate()
+
+    filename = f"policy_reports_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.zip"
+    return StreamingResponse(
+        stream_pdf_zip(results, missing, on_finish=count_exports),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
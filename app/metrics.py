@@ -0,0 +1,377 @@
+"""
+Metrics Module - Request latency histograms, MongoDB ping and event-loop lag
+=============================================================================
+
+Everything is measured in-process and kept per worker:
+
+    LatencyMiddleware   time to response start per route, request and 5xx counts
+    HealthSampler       background MongoDB ping and event-loop lag sampling
+
+Served as the dashboard's /system/health metrics and as Prometheus text at
+/metrics.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+from app.settings import (
+    METRICS_WINDOW_SECONDS, METRICS_PING_INTERVAL_SECONDS, METRICS_LOOP_LAG_INTERVAL_SECONDS,
+    HEALTH_API_P95_WARN_MS, HEALTH_DB_PING_WARN_MS, HEALTH_LOOP_LAG_WARN_MS
+)
+
+QUANTILES = [0.5, 0.95, 0.99]
+
+# Values are counted in microseconds, 16 linear sub-buckets per power of
+# two: at most ~6% relative error at any magnitude, like an HDR histogram
+# with one significant digit
+_SUB_BUCKET_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < _SUB_BUCKETS:
+        return micros
+    shift = micros.bit_length() - _SUB_BUCKET_BITS - 1
+    return (shift + 1) * _SUB_BUCKETS + ((micros >> shift) - _SUB_BUCKETS)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    if index < _SUB_BUCKETS:
+        return index
+    shift = index // _SUB_BUCKETS - 1
+    return ((index % _SUB_BUCKETS + _SUB_BUCKETS + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Log-linear histogram of durations with bounded memory and fast percentiles."""
+
+    def __init__(self):
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        index = _bucket_index(max(0, int(seconds * 1_000_000)))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self.total_seconds += other.total_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+
+    def percentile(self, quantile: float) -> float:
+        """Upper bound, in seconds, of the bucket holding the given quantile."""
+        if not self.count:
+            return 0.0
+        rank = quantile * self.count
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(_bucket_upper_bound(index) / 1_000_000, self.max_seconds)
+        return self.max_seconds
+
+
+class WindowedHistogram:
+    """
+    Latency of roughly the last window seconds.
+
+    Keeps the current and the previous window and rotates them, so a
+    snapshot covers between one and two windows of recent samples.
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self._current = LatencyHistogram()
+        self._previous = LatencyHistogram()
+        self._started = time.monotonic()
+
+    def _rotate(self) -> None:
+        now = time.monotonic()
+        if now - self._started >= self.window:
+            # After an idle stretch the previous window is stale as well
+            self._previous = self._current if now - self._started < 2 * self.window else LatencyHistogram()
+            self._current = LatencyHistogram()
+            self._started = now
+
+    def record(self, seconds: float) -> None:
+        self._rotate()
+        self._current.record(seconds)
+
+    def snapshot(self) -> LatencyHistogram:
+        self._rotate()
+        histogram = LatencyHistogram()
+        histogram.merge(self._previous)
+        histogram.merge(self._current)
+        return histogram
+
+
+class RouteStats:
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.requests = 0
+        self.errors = 0
+
+
+class RequestMetrics:
+    """Request counts, 5xx errors and latency per (method, route template)."""
+
+    def __init__(self, window: float = METRICS_WINDOW_SECONDS):
+        self.routes: dict[tuple[str, str], RouteStats] = {}
+        self.recent = WindowedHistogram(window)
+
+    def record(self, method: str, route: str, status_code: int, seconds: float) -> None:
+        stats = self.routes.get((method, route))
+        if stats is None:
+            stats = self.routes[(method, route)] = RouteStats()
+        stats.requests += 1
+        if status_code >= 500:
+            stats.errors += 1
+        stats.latency.record(seconds)
+        self.recent.record(seconds)
+
+    def summary(self) -> list[dict]:
+        """Per-route counts, error rate and latency percentiles in milliseconds."""
+        rows = []
+        for (method, route), stats in sorted(self.routes.items(), key=lambda item: item[0][1]):
+            rows.append({
+                "method": method,
+                "route": route,
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "error_rate": round(stats.errors / stats.requests, 4),
+                **{f"p{int(q * 100)}_ms": round(stats.latency.percentile(q) * 1000, 2) for q in QUANTILES}
+            })
+        return rows
+
+
+request_metrics = RequestMetrics()
+
+
+class LatencyMiddleware:
+    """
+    ASGI middleware recording every HTTP request in request_metrics.
+
+    Latency is measured up to the start of the response, so long-lived
+    streams (SSE, ZIP exports) count their time to first byte. Requests
+    are labelled with the matched route template rather than the raw path
+    to keep the number of series bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        recorded = False
+
+        def record(status_code: int) -> None:
+            nonlocal recorded
+            if not recorded:
+                recorded = True
+                route = scope.get("route")
+                request_metrics.record(
+                    scope["method"], getattr(route, "path", "unmatched"), status_code,
+                    time.perf_counter() - started
+                )
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                record(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            record(500)
+            raise
+
+
+class HealthSampler:
+    """
+    Background sampling of MongoDB ping latency and event-loop lag.
+
+    Event-loop lag is how late a sleep of METRICS_LOOP_LAG_INTERVAL_SECONDS
+    wakes up; blocking work on the loop shows up here before it shows up
+    in request latency.
+    """
+
+    def __init__(self):
+        self.ping = LatencyHistogram()
+        self.ping_failures = 0
+        self.last_ping_seconds: Optional[float] = None
+        self.last_ping_error: Optional[str] = None
+        # Outcome of the pings of about the last hour, for availability
+        self.recent_pings: deque[bool] = deque(maxlen=max(1, int(3600 / METRICS_PING_INTERVAL_SECONDS)))
+        self.loop_lag = WindowedHistogram(METRICS_WINDOW_SECONDS)
+        self.last_loop_lag_seconds = 0.0
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self, db) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._sample_ping(db)),
+                asyncio.create_task(self._sample_loop_lag())
+            ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def ping_once(self, db) -> None:
+        started = time.perf_counter()
+        try:
+            await db.command("ping")
+        except Exception as e:
+            self.ping_failures += 1
+            self.last_ping_seconds = None
+            self.last_ping_error = str(e)
+            self.recent_pings.append(False)
+            return
+        elapsed = time.perf_counter() - started
+        self.ping.record(elapsed)
+        self.last_ping_seconds = elapsed
+        self.last_ping_error = None
+        self.recent_pings.append(True)
+
+    async def _sample_ping(self, db) -> None:
+        while True:
+            await self.ping_once(db)
+            await asyncio.sleep(METRICS_PING_INTERVAL_SECONDS)
+
+    async def _sample_loop_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + METRICS_LOOP_LAG_INTERVAL_SECONDS
+            await asyncio.sleep(METRICS_LOOP_LAG_INTERVAL_SECONDS)
+            self.last_loop_lag_seconds = max(0.0, loop.time() - expected)
+            self.loop_lag.record(self.last_loop_lag_seconds)
+
+    @property
+    def availability(self) -> Optional[float]:
+        if not self.recent_pings:
+            return None
+        return sum(self.recent_pings) / len(self.recent_pings)
+
+
+health_sampler = HealthSampler()
+
+
+def _status(value_ms: float, warn_ms: float) -> str:
+    return "healthy" if value_ms <= warn_ms else "degraded"
+
+
+def health_metrics() -> list[dict]:
+    """
+    The /system/health metrics: name, status, display value and icon.
+
+    API latency is the p95 of roughly the last METRICS_WINDOW_SECONDS of
+    requests; event-loop lag is the p99 of the same window.
+    """
+    sampler = health_sampler
+    if sampler.last_ping_error is not None:
+        database_status = "down"
+    elif sampler.last_ping_seconds is None:
+        database_status = "unknown"
+    else:
+        database_status = _status(sampler.last_ping_seconds * 1000, HEALTH_DB_PING_WARN_MS)
+    availability = sampler.availability
+    ping_ms = sampler.last_ping_seconds * 1000 if sampler.last_ping_seconds is not None else None
+
+    recent = request_metrics.recent.snapshot()
+    api_p95_ms = recent.percentile(0.95) * 1000
+    loop_lag_ms = sampler.loop_lag.snapshot().percentile(0.99) * 1000
+
+    return [
+        {
+            "name": "Database",
+            "status": database_status,
+            "value": f"{availability * 100:.1f}%" if availability is not None else "n/a",
+            "icon": "CircleStackIcon"
+        },
+        {
+            "name": "Database Latency",
+            "status": database_status,
+            "value": f"{ping_ms:.0f}ms" if ping_ms is not None else "n/a",
+            "icon": "ServerIcon"
+        },
+        {
+            "name": "API Latency",
+            "status": _status(api_p95_ms, HEALTH_API_P95_WARN_MS) if recent.count else "healthy",
+            "value": f"{api_p95_ms:.0f}ms",
+            "icon": "ClockIcon"
+        },
+        {
+            "name": "Event Loop Lag",
+            "status": _status(loop_lag_ms, HEALTH_LOOP_LAG_WARN_MS),
+            "value": f"{loop_lag_ms:.0f}ms",
+            "icon": "BoltIcon"
+        }
+    ]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _summary_lines(name: str, histogram: LatencyHistogram, **labels) -> list[str]:
+    lines = [
+        f"{name}{_labels(**labels, quantile=q)} {histogram.percentile(q):.6f}" for q in QUANTILES
+    ]
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram.total_seconds:.6f}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+    return lines
+
+
+def render_prometheus() -> str:
+    """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+    lines = [
+        "# HELP http_request_duration_seconds Time to response start per route.",
+        "# TYPE http_request_duration_seconds summary"
+    ]
+    routes = sorted(request_metrics.routes.items())
+    for (method, route), stats in routes:
+        lines += _summary_lines("http_request_duration_seconds", stats.latency, method=method, route=route)
+
+    lines += ["# HELP http_requests_total Requests handled per route.", "# TYPE http_requests_total counter"]
+    lines += [f"http_requests_total{_labels(method=m, route=r)} {s.requests}" for (m, r), s in routes]
+    lines += [
+        "# HELP http_request_errors_total Requests answered with a 5xx status per route.",
+        "# TYPE http_request_errors_total counter"
+    ]
+    lines += [f"http_request_errors_total{_labels(method=m, route=r)} {s.errors}" for (m, r), s in routes]
+
+    sampler = health_sampler
+    lines += [
+        "# HELP mongodb_ping_duration_seconds Latency of the background MongoDB ping.",
+        "# TYPE mongodb_ping_duration_seconds summary",
+        *_summary_lines("mongodb_ping_duration_seconds", sampler.ping),
+        "# HELP mongodb_ping_failures_total Background MongoDB pings that failed.",
+        "# TYPE mongodb_ping_failures_total counter",
+        f"mongodb_ping_failures_total {sampler.ping_failures}",
+        "# HELP mongodb_up Whether the last background MongoDB ping succeeded.",
+        "# TYPE mongodb_up gauge",
+        f"mongodb_up {int(sampler.last_ping_seconds is not None)}",
+        "# HELP event_loop_lag_seconds How late the last event-loop probe woke up.",
+        "# TYPE event_loop_lag_seconds gauge",
+        f"event_loop_lag_seconds {sampler.last_loop_lag_seconds:.6f}",
+    ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,77 @@
+"""
+Data Migrations
+===============
+
+One-off backfills for documents written before a schema change.
+
+Usage:
+    python -m app.migrations
+"""
+import asyncio
+from app.db import get_db
+from app.nlp_storage import store_nlp_data
+
+
+async def backfill_assigned_role_key(db) -> int:
+    """
+    Store the canonical lowercase assigned_role_key on tasks that lack it.
+
+    Runs as a single server-side update with an aggregation pipeline, so no
+    task documents are pulled into the application.
+
+    Args:
+        db: Motor database handle
+
+    Returns:
+        Number of tasks updated
+    """
+    result = await db.tasks.update_many(
+        {"assigned_role_key": {"$exists": False}},
+        [{"$set": {
+            "assigned_role_key": {"$toLower": {"$trim": {"input": "$assigned_role"}}}
+        }}]
+    )
+    return result.modified_count
+
+
+async def compress_nlp_results(db) -> int:
+    """
+    Move inline, uncompressed nlp_data into compressed storage.
+
+    Results are converted one at a time, so only a single payload is held
+    in memory; large payloads are moved to GridFS.
+
+    Args:
+        db: Motor database handle
+
+    Returns:
+        Number of results converted
+    """
+    converted = 0
+    cursor = db.nlp_results.find({"nlp_data": {"$exists": True}}, {"result_id": 1, "nlp_data": 1})
+    async for result in cursor:
+        stored = await store_nlp_data(db, result["result_id"], result["nlp_data"])
+        await db.nlp_results.update_one(
+            {"_id": result["_id"]},
+            {"$set": stored, "$unset": {"nlp_data": ""}}
+        )
+        converted += 1
+    return converted
+
+
+MIGRATIONS = [
+    ("backfill_assigned_role_key", backfill_assigned_role_key),
+    ("compress_nlp_results", compress_nlp_results),
+]
+
+
+async def run_migrations() -> None:
+    db = get_db()
+    for name, migration in MIGRATIONS:
+        print(f"Running {name}...")
+        updated = await migration(db)
+        print(f"   ✅ {updated} documents updated")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_migrations())
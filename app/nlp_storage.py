@@ -0,0 +1,169 @@
+"""
+NLP Storage Module - Compressed storage of nlp_data payloads, inline or in GridFS
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+from bson import Binary
+from gridfs.errors import NoFile
+from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+from app.settings import NLP_COMPRESSION_LEVEL, NLP_INLINE_MAX_BYTES
+
+GRIDFS_BUCKET = "nlp_data"
+NLP_ENCODING = "gzip+json"
+
+# Document fields that hold the stored payload rather than result metadata
+STORAGE_FIELDS = ["nlp_data", "nlp_data_gz", "nlp_data_file_id"]
+
+# Reads a result without its inline compressed payload; load_nlp_data()
+# fetches it only when a PDF is actually rendered. Legacy uncompressed
+# nlp_data is kept, as its hash is computed from the payload itself.
+WITHOUT_PAYLOAD = {"_id": 0, "nlp_data_gz": 0}
+
+
+def _bucket(db) -> AsyncIOMotorGridFSBucket:
+    return AsyncIOMotorGridFSBucket(db, bucket_name=GRIDFS_BUCKET)
+
+
+def summarize_nlp_data(nlp_data: dict, raw: bytes) -> dict:
+    """Small inline summary kept next to the compressed payload."""
+    rules = nlp_data.get("rules") or []
+    roles = {rule.get("responsible_role") for rule in rules if isinstance(rule, dict)}
+    return {
+        "rule_count": len(rules),
+        "roles": sorted(role for role in roles if role),
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "raw_bytes": len(raw)
+    }
+
+
+def _compress(nlp_data: dict) -> tuple[bytes, dict]:
+    raw = json.dumps(nlp_data, separators=(",", ":"), default=str).encode()
+    return gzip.compress(raw, compresslevel=NLP_COMPRESSION_LEVEL), summarize_nlp_data(nlp_data, raw)
+
+
+def _decompress(data: bytes) -> dict:
+    return json.loads(gzip.decompress(data))
+
+
+async def store_nlp_data(db, result_id: str, nlp_data: dict) -> dict:
+    """
+    Compress nlp_data and decide where it lives.
+
+    Payloads whose compressed size is at most NLP_INLINE_MAX_BYTES stay in
+    the nlp_results document; larger ones go to the GridFS bucket, so the
+    result document stays small whatever the size of the policy.
+
+    Args:
+        db: Motor database handle
+        result_id: Result the payload belongs to
+        nlp_data: Payload to store
+
+    Returns:
+        Fields to $set on the nlp_results document
+    """
+    compressed, summary = await asyncio.to_thread(_compress, nlp_data)
+    summary.update({"stored_bytes": len(compressed), "encoding": NLP_ENCODING})
+
+    if len(compressed) <= NLP_INLINE_MAX_BYTES:
+        summary["storage"] = "inline"
+        return {"nlp_summary": summary, "nlp_data_gz": Binary(compressed)}
+
+    file_id = await _bucket(db).upload_from_stream(
+        result_id, compressed, metadata={"result_id": result_id, "encoding": NLP_ENCODING}
+    )
+    summary["storage"] = "gridfs"
+    return {"nlp_summary": summary, "nlp_data_file_id": file_id}
+
+
+async def load_nlp_data(db, result: dict) -> dict:
+    """
+    Return the decoded nlp_data of an nlp_results document.
+
+    Handles inline compressed, GridFS and legacy uncompressed documents,
+    also when the document was read with the WITHOUT_PAYLOAD projection.
+
+    Raises:
+        LookupError: if the result or its payload was deleted after the
+            document was read
+    """
+    if "nlp_data" in result:
+        return result["nlp_data"]
+    if "nlp_data_gz" in result:
+        return await asyncio.to_thread(_decompress, bytes(result["nlp_data_gz"]))
+    if "nlp_data_file_id" not in result:
+        stored = await db.nlp_results.find_one({"result_id": result["result_id"]}, {"nlp_data_gz": 1})
+        if stored is None or "nlp_data_gz" not in stored:
+            raise LookupError(f"NLP result {result['result_id']} no longer exists")
+        return await asyncio.to_thread(_decompress, bytes(stored["nlp_data_gz"]))
+
+    try:
+        stream = await _bucket(db).open_download_stream(result["nlp_data_file_id"])
+    except NoFile:
+        raise LookupError(f"NLP result {result['result_id']} no longer exists")
+    return await asyncio.to_thread(_decompress, await stream.read())
+
+
+async def drop_nlp_data(db) -> None:
+    """Remove every stored GridFS payload."""
+    await db[f"{GRIDFS_BUCKET}.files"].delete_many({})
+    await db[f"{GRIDFS_BUCKET}.chunks"].delete_many({})
+
+
+def nlp_data_hash(result: dict) -> str:
+    """
+    Stable hash of a result's nlp_data, taken from the stored summary when
+    present so the payload does not have to be loaded.
+    """
+    summary = result.get("nlp_summary")
+    if summary:
+        return summary["sha256"]
+    raw = json.dumps(result["nlp_data"], sort_keys=True, default=str).encode()
+    return hashlib.sha256(raw).hexdigest()
+
+
+async def compute_storage_stats(db) -> dict:
+    """
+    Aggregate stored payload sizes and the compression ratio per storage kind.
+
+    Returns:
+        {"results", "raw_bytes", "stored_bytes", "compression_ratio",
+         "by_storage": {kind: {...}}, "uncompressed_legacy"}
+    """
+    pipeline = [
+        {"$match": {"nlp_summary": {"$exists": True}}},
+        {"$group": {
+            "_id": "$nlp_summary.storage",
+            "results": {"$sum": 1},
+            "raw_bytes": {"$sum": "$nlp_summary.raw_bytes"},
+            "stored_bytes": {"$sum": "$nlp_summary.stored_bytes"}
+        }}
+    ]
+    groups, legacy = await asyncio.gather(
+        db.nlp_results.aggregate(pipeline).to_list(length=None),
+        db.nlp_results.count_documents({"nlp_data": {"$exists": True}})
+    )
+
+    def ratio(raw_bytes: int, stored_bytes: int) -> float:
+        return round(raw_bytes / stored_bytes, 2) if stored_bytes else 0.0
+
+    by_storage = {}
+    for group in groups:
+        by_storage[group["_id"]] = {
+            "results": group["results"],
+            "raw_bytes": group["raw_bytes"],
+            "stored_bytes": group["stored_bytes"],
+            "compression_ratio": ratio(group["raw_bytes"], group["stored_bytes"])
+        }
+
+    raw_bytes = sum(group["raw_bytes"] for group in by_storage.values())
+    stored_bytes = sum(group["stored_bytes"] for group in by_storage.values())
+    return {
+        "results": sum(group["results"] for group in by_storage.values()),
+        "raw_bytes": raw_bytes,
+        "stored_bytes": stored_bytes,
+        "compression_ratio": ratio(raw_bytes, stored_bytes),
+        "by_storage": by_storage,
+        "uncompressed_legacy": legacy
+    }
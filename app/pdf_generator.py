@@ -7,23 +7,175 @@ from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from io import BytesIO
 from datetime import datetime
+from functools import lru_cache
+from typing import BinaryIO
+from xml.sax.saxutils import escape
 
 
-def generate_policy_pdf(nlp_data: dict, file_name: str = "policy.pdf") -> BytesIO:
+# Rules per rules Table. Splitting a Table across pages re-measures every
+# remaining row, so one huge table lays out in quadratic time; bounded
+# chunks keep layout roughly linear in the number of rules.
+RULES_TABLE_CHUNK = 200
+
+# Rule ID, Action, Role and Deadline column widths of the rules table
+RULES_COL_WIDTHS = [0.8*inch, 3.2*inch, 1.2*inch, 1.3*inch]
+# Left plus right cell padding of the rules table
+RULE_CELL_PADDING = 12
+
+
+class ReportTemplate:
     """
-    Generate a formatted PDF from NLP policy data
+    Styles and table styles shared by every policy report.
+
+    Built once per process by get_report_template(); the objects are only
+    read while rendering, so reports reuse them instead of rebuilding the
+    stylesheet and style command lists on every call.
+    """
+
+    def __init__(self):
+        self.styles = getSampleStyleSheet()
+
+        self.title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=self.styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#2E3192'),
+            spaceAfter=30,
+            alignment=TA_CENTER
+        )
+
+        self.heading_style = ParagraphStyle(
+            'CustomHeading',
+            parent=self.styles['Heading2'],
+            fontSize=16,
+            textColor=colors.HexColor('#2E3192'),
+            spaceAfter=12,
+            spaceBefore=12
+        )
+
+        # Wrapped table cells, matching the 9pt body font of the rules table
+        self.cell_style = ParagraphStyle(
+            'RuleCell',
+            parent=self.styles['Normal'],
+            fontSize=9,
+            leading=11
+        )
+
+        self.footer_style = ParagraphStyle(
+            'Footer',
+            parent=self.styles['Normal'],
+            fontSize=8,
+            textColor=colors.grey,
+            alignment=TA_CENTER
+        )
+
+        self.metadata_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#E8E8E8')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ])
+
+        self.rules_table_style = TableStyle([
+            # Header styling
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2E3192')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('TOPPADDING', (0, 0), (-1, 0), 12),
+            
+            # Body styling
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
+            ('LEFTPADDING', (0, 0), (-1, -1), 6),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+            ('TOPPADDING', (0, 1), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+        ])
+
+        self.stats_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2E3192')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
+        ])
+
+    def rule_cell(self, text, col_width: float):
+        """
+        Plain string when the text fits its column on one line, wrapped
+        Paragraph otherwise. Fitting is measured in 9pt Helvetica, the body
+        font of the rules table, so plain strings skip Paragraph layout
+        without ever overflowing into the next column.
+        """
+        text = str(text)
+        if '\n' not in text and stringWidth(text, 'Helvetica', 9) <= col_width - RULE_CELL_PADDING:
+            return text
+        return Paragraph(escape(text), self.cell_style)
+
+
+@lru_cache(maxsize=None)
+def get_report_template() -> ReportTemplate:
+    """Return the process-wide report template, building it on first use."""
+    return ReportTemplate()
+
+
+def _rules_tables(rules: list, template: ReportTemplate) -> list:
+    """Lay the rules out as a sequence of bounded-size tables."""
+    header = ['Rule ID', 'Action', 'Role', 'Deadline']
+    tables = []
+    for start in range(0, len(rules), RULES_TABLE_CHUNK):
+        rules_data = [header]
+        for rule in rules[start:start + RULES_TABLE_CHUNK]:
+            values = [
+                rule.get('rule_id', 'N/A'),
+                rule.get('action', 'N/A'),
+                rule.get('responsible_role', 'N/A'),
+                rule.get('deadline') or 'Not specified'
+            ]
+            rules_data.append([
+                template.rule_cell(value, width) for value, width in zip(values, RULES_COL_WIDTHS)
+            ])
+
+        # Adjusted column widths to prevent text overlap
+        rules_table = Table(rules_data, colWidths=RULES_COL_WIDTHS, repeatRows=1)
+        rules_table.setStyle(template.rules_table_style)
+        tables.append(rules_table)
+    return tables
+
+
+def write_policy_pdf(nlp_data: dict, output: BinaryIO, file_name: str = "policy.pdf") -> None:
+    """
+    Render a formatted PDF from NLP policy data into a file object
+    
+    Writing straight to a file (or spooled temp file) avoids holding a
+    second in-memory copy of the finished document.
     
     Args:
         nlp_data: Dictionary containing policy data with rules
+        output: Writable binary file object receiving the PDF
         file_name: Name of the original policy file
-    
-    Returns:
-        BytesIO object containing the PDF
     """
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter,
+    doc = SimpleDocTemplate(output, pagesize=letter,
                            rightMargin=72, leftMargin=72,
                            topMargin=72, bottomMargin=18)
     
@@ -31,27 +183,10 @@ def generate_policy_pdf(nlp_data: dict, file_name: str = "policy.pdf") -> BytesI
     elements = []
     
     # Styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#2E3192'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#2E3192'),
-        spaceAfter=12,
-        spaceBefore=12
-    )
+    template = get_report_template()
     
     # Title
-    title = Paragraph("Policy Execution Report", title_style)
+    title = Paragraph("Policy Execution Report", template.title_style)
     elements.append(title)
     elements.append(Spacer(1, 12))
     
@@ -67,80 +202,28 @@ def generate_policy_pdf(nlp_data: dict, file_name: str = "policy.pdf") -> BytesI
     ]
     
     metadata_table = Table(metadata, colWidths=[2*inch, 4*inch])
-    metadata_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#E8E8E8')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
+    metadata_table.setStyle(template.metadata_table_style)
     
     elements.append(metadata_table)
     elements.append(Spacer(1, 20))
     
     # Rules Section
-    rules_heading = Paragraph("Extracted Rules & Tasks", heading_style)
+    rules_heading = Paragraph("Extracted Rules & Tasks", template.heading_style)
     elements.append(rules_heading)
     elements.append(Spacer(1, 12))
     
     rules = nlp_data.get('rules', [])
     
     if rules:
-        # Rules table header
-        rules_data = [['Rule ID', 'Action', 'Role', 'Deadline']]
-        
-        # Add each rule with Paragraph for text wrapping
-        for rule in rules:
-            # Use Paragraph for action text to enable wrapping
-            action_text = rule.get('action', 'N/A')
-            action_para = Paragraph(action_text, styles['Normal'])
-            
-            rules_data.append([
-                Paragraph(rule.get('rule_id', 'N/A'), styles['Normal']),
-                action_para,  # Wrapped text
-                Paragraph(rule.get('responsible_role', 'N/A'), styles['Normal']),
-                Paragraph(rule.get('deadline', 'Not specified'), styles['Normal'])
-            ])
-        
-        # Adjusted column widths to prevent text overlap
-        rules_table = Table(rules_data, colWidths=[0.8*inch, 3.2*inch, 1.2*inch, 1.3*inch])
-        rules_table.setStyle(TableStyle([
-            # Header styling
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2E3192')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('TOPPADDING', (0, 0), (-1, 0), 12),
-            
-            # Body styling
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ]))
-        
-        elements.append(rules_table)
+        elements.extend(_rules_tables(rules, template))
     else:
-        no_rules = Paragraph("No rules found in this policy.", styles['Normal'])
+        no_rules = Paragraph("No rules found in this policy.", template.styles['Normal'])
         elements.append(no_rules)
     
     elements.append(Spacer(1, 20))
     
     # Statistics Section
-    stats_heading = Paragraph("Statistics Summary", heading_style)
+    stats_heading = Paragraph("Statistics Summary", template.heading_style)
     elements.append(stats_heading)
     elements.append(Spacer(1, 12))
     
@@ -157,34 +240,33 @@ def generate_policy_pdf(nlp_data: dict, file_name: str = "policy.pdf") -> BytesI
         stats_data.append([f'{role} Tasks', str(count)])
     
     stats_table = Table(stats_data, colWidths=[3*inch, 2*inch])
-    stats_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2E3192')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
-    ]))
+    stats_table.setStyle(template.stats_table_style)
     
     elements.append(stats_table)
     
     # Footer
     elements.append(Spacer(1, 30))
     footer_text = "Generated by PolicyVision3.0 - Policy Execution Engine"
-    footer = Paragraph(footer_text, ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.grey,
-        alignment=TA_CENTER
-    ))
+    footer = Paragraph(footer_text, template.footer_style)
     elements.append(footer)
     
     # Build PDF
     doc.build(elements)
+
+
+def generate_policy_pdf(nlp_data: dict, file_name: str = "policy.pdf") -> BytesIO:
+    """
+    Generate a formatted PDF from NLP policy data
+    
+    Args:
+        nlp_data: Dictionary containing policy data with rules
+        file_name: Name of the original policy file
+    
+    Returns:
+        BytesIO object containing the PDF
+    """
+    buffer = BytesIO()
+    write_policy_pdf(nlp_data, buffer, file_name=file_name)
     
     # Get PDF data
     buffer.seek(0)
@@ -205,7 +287,7 @@ def generate_simple_pdf(data: dict) -> BytesIO:
     doc = SimpleDocTemplate(buffer, pagesize=letter)
     
     elements = []
-    styles = getSampleStyleSheet()
+    styles = get_report_template().styles
     
     title = Paragraph("Policy Data Export", styles['Title'])
     elements.append(title)
@@ -0,0 +1,232 @@
+"""
+PDF Job Module - Background rendering and on-disk caching of PDF reports
+"""
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Optional
+from app.cache import TTLCache
+from app.db import get_db
+from app.nlp_storage import load_nlp_data, nlp_data_hash
+from app.pdf_generator import write_policy_pdf
+from app.rendering import render_executor
+from app.settings import PDF_CACHE_DIR, PDF_CACHE_MAX_AGE_SECONDS, PDF_CACHE_MAX_BYTES, PDF_JOB_TTL_SECONDS
+
+
+def pdf_content_hash(result: dict) -> str:
+    """
+    Hash of everything that goes into a result's PDF.
+
+    Used both in the artifact file name and as the download ETag, so a
+    stored PDF is reused until the underlying NLP data changes. Built from
+    the stored payload hash, so checking it does not decompress nlp_data.
+    """
+    content = json.dumps([nlp_data_hash(result), result["file_name"]])
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def render_pdf_artifact(nlp_data: dict, file_name: str, path: str) -> str:
+    """
+    Render a policy PDF straight to disk.
+
+    Runs on the render executor. The document is written directly to a
+    temporary file, never buffered in memory as a whole, and renamed into
+    place so readers never see a partial PDF.
+
+    Returns:
+        The path of the rendered PDF
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            write_policy_pdf(nlp_data, f, file_name=file_name)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
+
+
+# Stored PDFs used this recently are never evicted for size: their path may
+# have been handed to a response that has not opened the file yet
+PDF_CACHE_GRACE_SECONDS = 60
+
+
+def prune_pdf_cache(cache_dir: str, max_age: int = PDF_CACHE_MAX_AGE_SECONDS,
+                    max_bytes: int = PDF_CACHE_MAX_BYTES, keep: Optional[str] = None) -> dict:
+    """
+    Delete stored PDFs past the age or size cap.
+
+    A file's mtime is its last use (ensure_artifact touches it on every
+    hit), so files unused for max_age seconds are removed first, then the
+    least recently used ones until the cache fits in max_bytes. keep and
+    files used within PDF_CACHE_GRACE_SECONDS are never removed, so the
+    cache may stay above max_bytes until they age. Leftover .tmp files of crashed renders are aged out the
+    same way.
+
+    Returns:
+        {"files", "bytes", "evicted"} after pruning
+    """
+    try:
+        entries = [entry for entry in os.scandir(cache_dir) if entry.is_file()]
+    except FileNotFoundError:
+        return {"files": 0, "bytes": 0, "evicted": 0}
+
+    files = []
+    for entry in entries:
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, entry.path))
+    files.sort()
+
+    now = time.time()
+    total = sum(size for _, size, _ in files)
+    evicted = 0
+    for mtime, size, path in files:
+        expired = max_age and now - mtime > max_age
+        over_size = (
+            max_bytes and total > max_bytes and path.endswith(".pdf")
+            and now - mtime > PDF_CACHE_GRACE_SECONDS
+        )
+        if path == keep or not (expired or over_size):
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        evicted += 1
+    return {"files": len(files) - evicted, "bytes": total, "evicted": evicted}
+
+
+class PDFJobManager:
+    """
+    Renders PDFs on the render executor and keeps the results on local disk.
+
+    Artifacts are keyed by result_id plus content hash. Concurrent requests
+    for the same artifact share a single render. The directory is pruned
+    to PDF_CACHE_MAX_AGE_SECONDS and PDF_CACHE_MAX_BYTES after each render.
+    Job records live in memory for PDF_JOB_TTL_SECONDS and are local to
+    this worker process.
+    """
+
+    def __init__(self, cache_dir: str = PDF_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._renders: dict[str, asyncio.Future] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._jobs = TTLCache(maxsize=10000, ttl=PDF_JOB_TTL_SECONDS)
+        self._cache_usage = {"files": 0, "bytes": 0, "evicted": 0}
+
+    def artifact_path(self, result_id: str, content_hash: str) -> str:
+        return os.path.join(self.cache_dir, f"{result_id}-{content_hash}.pdf")
+
+    async def ensure_artifact(self, result: dict) -> tuple[str, str]:
+        """
+        Return the stored PDF for an NLP result, rendering it if needed.
+
+        Args:
+            result: nlp_results document (needs result_id, file_name and the
+                stored payload fields)
+
+        Returns:
+            (path of the PDF on disk, content hash)
+
+        Raises:
+            RenderQueueFull: if a render is needed and the queue is full
+        """
+        content_hash = pdf_content_hash(result)
+        path = self.artifact_path(result["result_id"], content_hash)
+        try:
+            # Mark the artifact as recently used for LRU eviction
+            os.utime(path)
+            return path, content_hash
+        except FileNotFoundError:
+            pass
+
+        render = self._renders.get(path)
+        if render is None:
+            render_executor.check_capacity()
+            os.makedirs(self.cache_dir, exist_ok=True)
+            render = asyncio.ensure_future(self._render(result, path))
+            self._renders[path] = render
+            render.add_done_callback(lambda _: self._renders.pop(path, None))
+
+        await asyncio.shield(render)
+        return path, content_hash
+
+    async def _render(self, result: dict, path: str) -> str:
+        nlp_data = await load_nlp_data(get_db(), result)
+        await render_executor.run(render_pdf_artifact, nlp_data, result["file_name"], path)
+        usage = await asyncio.to_thread(prune_pdf_cache, self.cache_dir, keep=path)
+        usage["evicted"] += self._cache_usage["evicted"]
+        self._cache_usage = usage
+        return path
+
+    async def clear(self) -> None:
+        """Delete every stored PDF (used when the database is reset)."""
+        await asyncio.to_thread(shutil.rmtree, self.cache_dir, True)
+        self._cache_usage = {"files": 0, "bytes": 0, "evicted": self._cache_usage["evicted"]}
+
+    def stats(self) -> dict:
+        """Stored PDFs and evictions as of the last render, per worker process."""
+        return {"cache_dir": self.cache_dir, "renders_in_flight": len(self._renders), **self._cache_usage}
+
+    def submit(self, result: dict) -> dict:
+        """
+        Queue a background render for an NLP result.
+
+        Returns:
+            The new job record
+
+        Raises:
+            RenderQueueFull: if the PDF needs rendering and the queue is full,
+                so the job is rejected up front rather than failing later
+        """
+        content_hash = pdf_content_hash(result)
+        path = self.artifact_path(result["result_id"], content_hash)
+        if not os.path.exists(path) and path not in self._renders:
+            render_executor.check_capacity()
+
+        job = {
+            "job_id": str(uuid.uuid4()),
+            "result_id": result["result_id"],
+            "status": "queued",
+            "progress": 0,
+            "created_at": datetime.utcnow().isoformat(),
+            "completed_at": None,
+            "etag": None,
+            "error": None
+        }
+        self._jobs.set(job["job_id"], job)
+        task = asyncio.create_task(self._run(job, result))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _run(self, job: dict, result: dict) -> None:
+        job["status"] = "rendering"
+        job["progress"] = 50
+        try:
+            _, content_hash = await self.ensure_artifact(result)
+        except Exception as e:
+            job["status"] = "failed"
+            job["error"] = str(e)
+        else:
+            job["status"] = "completed"
+            job["progress"] = 100
+            job["etag"] = content_hash
+        job["completed_at"] = datetime.utcnow().isoformat()
+
+    def get(self, job_id: str) -> Optional[dict]:
+        return self._jobs.get(job_id)
+
+
+pdf_jobs = PDFJobManager()
@@ -0,0 +1,80 @@
+"""
+Rendering Executor Module - Runs CPU-bound PDF rendering off the event loop
+"""
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from app.settings import PDF_EXECUTOR, PDF_MAX_PENDING, PDF_RETRY_AFTER_SECONDS, PDF_WORKERS
+
+
+class RenderQueueFull(Exception):
+    """Raised when the render queue is at capacity; callers should retry later."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"PDF render queue is full, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class RenderExecutor:
+    """
+    Bounded thread or process pool for PDF rendering.
+
+    At most max_pending renders may be running or queued at once; further
+    submissions fail fast with RenderQueueFull instead of piling up, so a
+    burst of large reports cannot grow memory or latency without bound.
+    """
+
+    def __init__(self, kind: str = PDF_EXECUTOR, max_workers: int = PDF_WORKERS,
+                 max_pending: int = PDF_MAX_PENDING, retry_after: int = PDF_RETRY_AFTER_SECONDS):
+        if kind not in ("process", "thread"):
+            raise ValueError(f"Unknown PDF executor kind: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_pending = max(max_pending, max_workers)
+        self.retry_after = retry_after
+        self.pending = 0
+        self._executor: Optional[Executor] = None
+
+    @property
+    def is_full(self) -> bool:
+        return self.pending >= self.max_pending
+
+    def check_capacity(self) -> None:
+        """Raise RenderQueueFull if no render can be accepted right now."""
+        if self.is_full:
+            raise RenderQueueFull(self.retry_after)
+
+    async def run(self, fn: Callable, *args: Any) -> Any:
+        """
+        Run fn(*args) on the pool and await its result.
+
+        Raises:
+            RenderQueueFull: if max_pending renders are already in flight
+        """
+        self.check_capacity()
+        if self._executor is None:
+            pool = ProcessPoolExecutor if self.kind == "process" else ThreadPoolExecutor
+            self._executor = pool(max_workers=self.max_workers)
+
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
+
+    def stats(self) -> dict:
+        """Pool configuration and renders currently running or queued."""
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+render_executor = RenderExecutor()
@@ -0,0 +1,42 @@
+"""
+Response Module - Opt-in fast JSON serialization for the hot endpoints
+"""
+from typing import Any
+from fastapi.responses import JSONResponse
+from app.settings import FAST_JSON
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+FAST_JSON_ENABLED = FAST_JSON and orjson is not None
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+
+    Handles datetimes and enums natively; anything else orjson does not
+    know (e.g. ObjectId) is rendered with str().
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+DEFAULT_RESPONSE_CLASS = FastJSONResponse if FAST_JSON_ENABLED else JSONResponse
+
+
+def json_response(content: Any) -> Any:
+    """
+    Return documents read straight from MongoDB.
+
+    With FAST_JSON enabled the content is serialized by orjson as-is,
+    skipping FastAPI's jsonable_encoder pass and response_model
+    revalidation; callers must already have shaped it to the documented
+    schema. Otherwise the content is handed back to FastAPI unchanged.
+    """
+    if FAST_JSON_ENABLED:
+        return FastJSONResponse(content)
+    return content
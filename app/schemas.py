@@ -10,6 +10,10 @@ class TaskStatus(str, Enum):
     COMPLETED = "COMPLETED"
     ESCALATED = "ESCALATED"
 
+def normalize_role(role: str) -> str:
+    """Canonical lowercase form of a role, stored on tasks as assigned_role_key."""
+    return role.strip().lower()
+
 class PolicySchema(BaseModel):
     policy_id: str
     file_name: Optional[str] = None
@@ -50,6 +54,20 @@ class TaskUpdateStatusRequest(BaseModel):
 class TaskEscalateRequest(BaseModel):
     role: str
 
+class BulkTaskSelection(BaseModel):
+    """Tasks targeted by a bulk operation: explicit ids and/or filters."""
+    task_ids: Optional[list[str]] = None
+    policy_id: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    assigned_role: Optional[str] = None
+
+class BulkTaskUpdateStatusRequest(BulkTaskSelection):
+    new_status: TaskStatus
+    role: str
+
+class BulkTaskEscalateRequest(BulkTaskSelection):
+    role: str
+
 # NLP Results Schemas
 class NLPResultSchema(BaseModel):
     result_id: str
@@ -63,3 +81,9 @@ class SaveNLPResultRequest(BaseModel):
     policy_id: str
     file_name: str
     nlp_data: dict
+
+class NLPResultExportRequest(BaseModel):
+    """NLP results to export: explicit ids and/or an upload date range."""
+    result_ids: Optional[list[str]] = None
+    uploaded_from: Optional[datetime] = None
+    uploaded_to: Optional[datetime] = None
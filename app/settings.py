@@ -0,0 +1,92 @@
+"""
+Settings Module - Environment-driven configuration
+"""
+import os
+
+# PDF rendering
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", "pdf_cache")
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", str(min(4, os.cpu_count() or 1))))
+PDF_JOB_TTL_SECONDS = int(os.getenv("PDF_JOB_TTL_SECONDS", "3600"))
+# Stored PDFs unused for longer than this are deleted; the least recently
+# used ones go first once the cache holds more than PDF_CACHE_MAX_BYTES.
+# 0 disables either cap
+PDF_CACHE_MAX_AGE_SECONDS = int(os.getenv("PDF_CACHE_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", str(1024 ** 3)))
+# "process" isolates rendering from the event loop's GIL; "thread" avoids
+# process start-up and pickling costs for small reports
+PDF_EXECUTOR = os.getenv("PDF_EXECUTOR", "process")
+# Renders running or queued before new ones are rejected with 503
+PDF_MAX_PENDING = int(os.getenv("PDF_MAX_PENDING", str(PDF_WORKERS * 4)))
+PDF_RETRY_AFTER_SECONDS = int(os.getenv("PDF_RETRY_AFTER_SECONDS", "5"))
+
+# NLP result storage
+# Compressed nlp_data larger than this is moved out of the document into GridFS
+NLP_INLINE_MAX_BYTES = int(os.getenv("NLP_INLINE_MAX_BYTES", str(1024 * 1024)))
+NLP_COMPRESSION_LEVEL = int(os.getenv("NLP_COMPRESSION_LEVEL", "6"))
+
+# API responses
+# Serialize hot endpoints with orjson (when installed) instead of FastAPI's
+# encoder and response_model revalidation
+FAST_JSON = os.getenv("FAST_JSON", "0") == "1"
+# Responses smaller than this are sent uncompressed; 0 disables gzip
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "5"))
+
+# Real-time events
+# Events buffered per subscriber before it is told to resync instead
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "1000"))
+EVENTS_KEEPALIVE_SECONDS = int(os.getenv("EVENTS_KEEPALIVE_SECONDS", "15"))
+
+# Read-heavy dashboard endpoints
+# Cached results are dropped on writes handled by the same worker; other
+# workers serve them for at most this long
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "10"))
+RESPONSE_CACHE_MAXSIZE = int(os.getenv("RESPONSE_CACHE_MAXSIZE", "256"))
+
+# MongoDB
+# Deployments must set MONGO_URL; credentials never live in the source
+MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017")
+# Database used when MONGO_URL does not name one
+MONGO_DB_NAME = os.getenv("MONGO_DB_NAME", "policy_execution_db")
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "60000"))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "10000"))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "10000"))
+# 0 means no timeout
+MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "0"))
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "0"))
+# primary, primaryPreferred, secondary, secondaryPreferred or nearest
+MONGO_READ_PREFERENCE = os.getenv("MONGO_READ_PREFERENCE", "primary")
+# e.g. "majority" or "1"; empty uses the server default
+MONGO_WRITE_CONCERN = os.getenv("MONGO_WRITE_CONCERN", "")
+# Comma-separated wire compressors, e.g. "zstd,snappy,zlib"; empty disables
+MONGO_COMPRESSORS = os.getenv("MONGO_COMPRESSORS", "")
+# Analytics and history endpoints tolerate replication lag, so their reads
+# go to secondaries when available. Staleness must be at least 90 seconds;
+# -1 disables the limit
+ANALYTICS_READ_PREFERENCE = os.getenv("ANALYTICS_READ_PREFERENCE", "secondaryPreferred")
+ANALYTICS_MAX_STALENESS_SECONDS = int(os.getenv("ANALYTICS_MAX_STALENESS_SECONDS", "90"))
+
+# Health metrics
+# Recent-latency window behind /system/health; /metrics is cumulative
+METRICS_WINDOW_SECONDS = float(os.getenv("METRICS_WINDOW_SECONDS", "60"))
+METRICS_PING_INTERVAL_SECONDS = float(os.getenv("METRICS_PING_INTERVAL_SECONDS", "10"))
+METRICS_LOOP_LAG_INTERVAL_SECONDS = float(os.getenv("METRICS_LOOP_LAG_INTERVAL_SECONDS", "0.5"))
+# Above these a health metric is reported as degraded
+HEALTH_API_P95_WARN_MS = float(os.getenv("HEALTH_API_P95_WARN_MS", "500"))
+HEALTH_DB_PING_WARN_MS = float(os.getenv("HEALTH_DB_PING_WARN_MS", "100"))
+HEALTH_LOOP_LAG_WARN_MS = float(os.getenv("HEALTH_LOOP_LAG_WARN_MS", "100"))
+
+# Storage statistics
+# collStats/dbStats are expensive on large databases; /system/storage
+# recomputes them at most this often
+STORAGE_STATS_TTL_SECONDS = float(os.getenv("STORAGE_STATS_TTL_SECONDS", "300"))
+# Storage quota; 0 uses the size of the server's filesystem when reported
+STORAGE_CAPACITY_GB = float(os.getenv("STORAGE_CAPACITY_GB", "0"))
+# Capacity alert thresholds; 0 disables an alert
+STORAGE_USAGE_ALERT_PERCENT = float(os.getenv("STORAGE_USAGE_ALERT_PERCENT", "80"))
+NLP_RESULTS_ALERT_GB = float(os.getenv("NLP_RESULTS_ALERT_GB", "5"))
+NLP_RESULTS_ALERT_DOCUMENTS = int(os.getenv("NLP_RESULTS_ALERT_DOCUMENTS", "0"))
+AUDIT_LOGS_ALERT_GB = float(os.getenv("AUDIT_LOGS_ALERT_GB", "2"))
+AUDIT_LOGS_ALERT_DOCUMENTS = int(os.getenv("AUDIT_LOGS_ALERT_DOCUMENTS", "10000000"))
@@ -0,0 +1,169 @@
+"""
+Statistics Module - Server-side aggregations for dashboard metrics
+"""
+import asyncio
+from typing import Optional
+
+TASK_STATUSES = ["CREATED", "ASSIGNED", "IN_PROGRESS", "COMPLETED", "ESCALATED"]
+
+
+async def compute_policy_stats(db) -> dict:
+    """
+    Compute global policy and task counts for the dashboard.
+
+    Runs one $group aggregation per collection, concurrently, instead of a
+    count_documents round trip per metric.
+
+    Args:
+        db: Motor database handle
+
+    Returns:
+        Dictionary in the /policies/stats response shape
+    """
+    policy_pipeline = [
+        {"$group": {
+            "_id": None,
+            "total": {"$sum": 1},
+            "active": {"$sum": {"$cond": [{"$eq": ["$status", "ACTIVE"]}, 1, 0]}}
+        }}
+    ]
+    task_pipeline = [
+        {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+    ]
+
+    policy_rows, task_rows = await asyncio.gather(
+        db.policies.aggregate(policy_pipeline).to_list(length=1),
+        db.tasks.aggregate(task_pipeline).to_list(length=None)
+    )
+
+    policy_counts = policy_rows[0] if policy_rows else {"total": 0, "active": 0}
+    status_counts = {row["_id"]: row["count"] for row in task_rows}
+
+    total_policies = policy_counts["total"]
+    active_policies = policy_counts["active"]
+
+    return {
+        "total_policies": total_policies,
+        "active_policies": active_policies,
+        "completed_policies": 0,  # Can be calculated based on all tasks completed
+        "pending_policies": total_policies - active_policies,
+        "total_tasks": sum(status_counts.values()),
+        "created_tasks": status_counts.get("CREATED", 0),
+        "assigned_tasks": status_counts.get("ASSIGNED", 0),
+        "in_progress_tasks": status_counts.get("IN_PROGRESS", 0),
+        "completed_tasks": status_counts.get("COMPLETED", 0),
+        "escalated_tasks": status_counts.get("ESCALATED", 0)
+    }
+
+
+async def compute_task_stats(db, role_key: Optional[str] = None) -> dict:
+    """
+    Count tasks per status, for every role or one normalized role.
+
+    Args:
+        db: Motor database handle
+        role_key: Optional normalized role to count for
+
+    Returns:
+        Dictionary in the /tasks/stats response shape
+    """
+    pipeline = [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+    if role_key:
+        pipeline.insert(0, {"$match": {"assigned_role_key": role_key}})
+    rows = await db.tasks.aggregate(pipeline).to_list(length=None)
+
+    tasks_by_status = {status: 0 for status in TASK_STATUSES}
+    tasks_by_status.update({row["_id"]: row["count"] for row in rows})
+    return {"role_key": role_key, "total_tasks": sum(tasks_by_status.values()), "tasks_by_status": tasks_by_status}
+
+
+async def compute_single_policy_stats(db, policy_id: str) -> dict:
+    """
+    Compute execution statistics for one policy in a single aggregation.
+
+    Status and role counts are grouped server-side (backed by the
+    (policy_id, status, assigned_role) index), and the average completion
+    time is derived from the TASK_CREATED and "-> COMPLETED" audit-log
+    timestamps of each completed task in the same pipeline.
+
+    Args:
+        db: Motor database handle
+        policy_id: Policy to report on
+
+    Returns:
+        Dictionary in the /policies/stats/{policy_id} response shape
+    """
+    pipeline = [
+        {"$match": {"policy_id": policy_id}},
+        {"$facet": {
+            "by_status": [
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+            ],
+            "by_role": [
+                {"$group": {"_id": "$assigned_role", "count": {"$sum": 1}}}
+            ],
+            "completion": [
+                {"$match": {"status": "COMPLETED"}},
+                {"$lookup": {
+                    "from": "audit_logs",
+                    "localField": "task_id",
+                    "foreignField": "task_id",
+                    "pipeline": [
+                        {"$match": {"$or": [
+                            {"action": "TASK_CREATED"},
+                            {"action": {"$regex": "-> COMPLETED$"}}
+                        ]}},
+                        {"$project": {"_id": 0, "timestamp": 1}}
+                    ],
+                    "as": "logs"
+                }},
+                {"$project": {
+                    "duration_ms": {"$subtract": [
+                        {"$max": "$logs.timestamp"},
+                        {"$min": "$logs.timestamp"}
+                    ]}
+                }},
+                {"$match": {"duration_ms": {"$gt": 0}}},
+                {"$group": {
+                    "_id": None,
+                    "total_ms": {"$sum": "$duration_ms"},
+                    "count": {"$sum": 1}
+                }}
+            ]
+        }}
+    ]
+
+    rows = await db.tasks.aggregate(pipeline).to_list(length=1)
+    facets = rows[0] if rows else {"by_status": [], "by_role": [], "completion": []}
+
+    # Initialize counters
+    tasks_by_status = {status: 0 for status in TASK_STATUSES}
+    for row in facets["by_status"]:
+        status = row["_id"] or "CREATED"
+        tasks_by_status[status] = tasks_by_status.get(status, 0) + row["count"]
+
+    tasks_by_role = {}
+    for row in facets["by_role"]:
+        role = row["_id"] or "Unknown"
+        tasks_by_role[role] = tasks_by_role.get(role, 0) + row["count"]
+
+    total_tasks = sum(tasks_by_status.values())
+
+    # Calculate completion rate
+    completion_rate = 0
+    if total_tasks > 0:
+        completion_rate = int((tasks_by_status["COMPLETED"] / total_tasks) * 100)
+
+    average_hours = 0
+    if facets["completion"]:
+        completion = facets["completion"][0]
+        average_hours = round(completion["total_ms"] / completion["count"] / 3_600_000, 2)
+
+    return {
+        "policy_id": policy_id,
+        "total_tasks": total_tasks,
+        "tasks_by_status": tasks_by_status,
+        "tasks_by_role": tasks_by_role,
+        "completion_rate_percent": completion_rate,
+        "average_completion_time_hours": average_hours
+    }
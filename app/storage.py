@@ -0,0 +1,149 @@
+"""
+Storage Module - Collection and database sizes from MongoDB stats, with capacity alerts
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+from pymongo.errors import OperationFailure
+from app.nlp_storage import GRIDFS_BUCKET
+from app.settings import (
+    STORAGE_CAPACITY_GB, STORAGE_USAGE_ALERT_PERCENT,
+    NLP_RESULTS_ALERT_GB, NLP_RESULTS_ALERT_DOCUMENTS, AUDIT_LOGS_ALERT_GB, AUDIT_LOGS_ALERT_DOCUMENTS
+)
+
+logger = logging.getLogger(__name__)
+
+GB = 1024 ** 3
+
+COLLECTIONS = ["policies", "tasks", "audit_logs", "nlp_results"]
+GRIDFS_COLLECTIONS = [f"{GRIDFS_BUCKET}.files", f"{GRIDFS_BUCKET}.chunks"]
+
+# Collections that grow without bound -> (GB threshold, document threshold); 0 disables
+CAPACITY_THRESHOLDS = {
+    "nlp_results": (NLP_RESULTS_ALERT_GB, NLP_RESULTS_ALERT_DOCUMENTS),
+    "audit_logs": (AUDIT_LOGS_ALERT_GB, AUDIT_LOGS_ALERT_DOCUMENTS),
+}
+
+_EMPTY_STATS = {"count": 0, "size": 0, "storageSize": 0, "totalIndexSize": 0, "avgObjSize": 0}
+
+
+async def collection_stats(db, name: str) -> dict:
+    """
+    Document count, data, storage and index size of one collection.
+
+    Uses the $collStats aggregation stage and falls back to the collStats
+    command on servers or users that cannot run it. A collection that does
+    not exist yet reports zeros.
+
+    Returns:
+        {"count", "size", "storageSize", "totalIndexSize", "avgObjSize"}
+    """
+    try:
+        rows = await db[name].aggregate([{"$collStats": {"storageStats": {}}}]).to_list(length=None)
+        # Sharded collections report one row per shard
+        shards = [row["storageStats"] for row in rows]
+    except OperationFailure:
+        try:
+            shards = [await db.command("collStats", name)]
+        except OperationFailure:
+            return dict(_EMPTY_STATS)
+
+    stats = {field: sum(shard.get(field, 0) for shard in shards) for field in _EMPTY_STATS}
+    stats["avgObjSize"] = stats["size"] // stats["count"] if stats["count"] else 0
+    return stats
+
+
+def _gb(size: float) -> float:
+    return round(size / GB, 3)
+
+
+def _capacity_alerts(collections: dict, used_bytes: int, total_bytes: Optional[int]) -> list[dict]:
+    alerts = []
+    for name, (limit_gb, limit_documents) in CAPACITY_THRESHOLDS.items():
+        stats = collections[name]
+        if limit_gb and stats["size_gb"] > limit_gb:
+            alerts.append({
+                "collection": name,
+                "metric": "size_gb",
+                "value": stats["size_gb"],
+                "threshold": limit_gb,
+                "message": f"{name} holds {stats['size_gb']} GB, above the {limit_gb} GB threshold"
+            })
+        if limit_documents and stats["documents"] > limit_documents:
+            alerts.append({
+                "collection": name,
+                "metric": "documents",
+                "value": stats["documents"],
+                "threshold": limit_documents,
+                "message": f"{name} holds {stats['documents']} documents, above the {limit_documents} threshold"
+            })
+
+    if total_bytes and STORAGE_USAGE_ALERT_PERCENT:
+        used_percent = round(used_bytes / total_bytes * 100, 1)
+        if used_percent > STORAGE_USAGE_ALERT_PERCENT:
+            alerts.append({
+                "collection": None,
+                "metric": "used_percent",
+                "value": used_percent,
+                "threshold": STORAGE_USAGE_ALERT_PERCENT,
+                "message": f"Storage is {used_percent}% used, above the {STORAGE_USAGE_ALERT_PERCENT}% threshold"
+            })
+    return alerts
+
+
+async def compute_storage_usage(db) -> dict:
+    """
+    Build the /system/storage response from collStats and dbStats.
+
+    The size of an NLP result includes its GridFS payload. Used storage is
+    the database's on-disk storage plus index size; capacity comes from
+    STORAGE_CAPACITY_GB, or from the size of the server's filesystem when
+    that is not set (not reported by every hosted tier).
+
+    Returns:
+        {"total_storage_gb", "used_storage_gb", "available_gb", "breakdown",
+         "collections", "alerts", "measured_at"}
+    """
+    names = COLLECTIONS + GRIDFS_COLLECTIONS
+    *stats, db_stats = await asyncio.gather(
+        *(collection_stats(db, name) for name in names),
+        db.command("dbStats")
+    )
+    stats = dict(zip(names, stats))
+    for name in GRIDFS_COLLECTIONS:
+        for field in ("size", "storageSize", "totalIndexSize"):
+            stats["nlp_results"][field] += stats[name][field]
+
+    collections = {
+        name: {
+            "documents": stats[name]["count"],
+            "size_gb": _gb(stats[name]["size"]),
+            "storage_gb": _gb(stats[name]["storageSize"]),
+            "index_gb": _gb(stats[name]["totalIndexSize"]),
+            "avg_document_bytes": stats[name]["avgObjSize"]
+        }
+        for name in COLLECTIONS
+    }
+
+    used_bytes = db_stats.get("storageSize", 0) + db_stats.get("indexSize", 0)
+    total_bytes = STORAGE_CAPACITY_GB * GB if STORAGE_CAPACITY_GB else db_stats.get("fsTotalSize")
+
+    alerts = _capacity_alerts(collections, used_bytes, total_bytes)
+    for alert in alerts:
+        logger.warning("Capacity alert: %s", alert["message"])
+
+    document_bytes = sum(stats[name]["storageSize"] for name in ("policies", "tasks", "audit_logs"))
+    return {
+        "total_storage_gb": _gb(total_bytes) if total_bytes else None,
+        "used_storage_gb": _gb(used_bytes),
+        "available_gb": _gb(total_bytes - used_bytes) if total_bytes else None,
+        "breakdown": [
+            {"name": "Documents", "value": _gb(document_bytes), "color": "#00FFFF"},
+            {"name": "Processed Data", "value": _gb(stats["nlp_results"]["storageSize"]), "color": "#8A2BE2"},
+            {"name": "Indexes", "value": _gb(db_stats.get("indexSize", 0)), "color": "#FF1493"}
+        ],
+        "collections": collections,
+        "alerts": alerts,
+        "measured_at": datetime.utcnow().isoformat()
+    }
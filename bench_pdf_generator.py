@@ -0,0 +1,40 @@
+import os
+import time
+from app.pdf_generator import generate_policy_pdf
+
+SIZES = [int(n) for n in os.getenv("BENCH_RULE_COUNTS", "10,1000,10000").split(",")]
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "3"))
+
+def make_payload(num_rules):
+    roles = ["Clerk", "Officer", "Admin"]
+    return {
+        "policy_id": f"BENCH-{num_rules}",
+        "rules": [
+            {
+                "rule_id": f"R{i}",
+                # Mix of short actions and ones long enough to need wrapping
+                "action": "Verify applicant documents" if i % 3 else
+                          "Verify applicant residency, income eligibility and supporting documents before approval",
+                "responsible_role": roles[i % 3],
+                "deadline": "5 business days"
+            }
+            for i in range(num_rules)
+        ]
+    }
+
+def bench_pdf_generator():
+    print(f"generate_policy_pdf, best of {ROUNDS}:")
+    for num_rules in SIZES:
+        payload = make_payload(num_rules)
+        timings = []
+        size = 0
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            buffer = generate_policy_pdf(payload, file_name="bench.pdf")
+            timings.append(time.perf_counter() - start)
+            size = buffer.getbuffer().nbytes
+        best = min(timings)
+        print(f"   {num_rules:>6} rules   {best * 1000:9.1f}ms   {best / num_rules * 1e6:8.1f}µs/rule   {size / 1024:8.1f}KB")
+
+if __name__ == "__main__":
+    bench_pdf_generator()
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import random
+import time
+import uuid
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.stats import compute_policy_stats, TASK_STATUSES
+
+# Benchmarks write to a throwaway database on a local mongod, never to Atlas
+BENCH_MONGO_URL = os.getenv("BENCH_MONGO_URL", "mongodb://localhost:27017/policy_stats_bench")
+NUM_TASKS = int(os.getenv("BENCH_NUM_TASKS", "1000000"))
+NUM_POLICIES = int(os.getenv("BENCH_NUM_POLICIES", "1000"))
+BATCH_SIZE = 10000
+ROUNDS = 5
+
+async def legacy_policy_stats(db):
+    """Previous implementation: one count_documents round trip per metric."""
+    total_policies = await db.policies.count_documents({})
+    active_policies = await db.policies.count_documents({"status": "ACTIVE"})
+    total_tasks = await db.tasks.count_documents({})
+    created_tasks = await db.tasks.count_documents({"status": "CREATED"})
+    assigned_tasks = await db.tasks.count_documents({"status": "ASSIGNED"})
+    in_progress_tasks = await db.tasks.count_documents({"status": "IN_PROGRESS"})
+    completed_tasks = await db.tasks.count_documents({"status": "COMPLETED"})
+    escalated_tasks = await db.tasks.count_documents({"status": "ESCALATED"})
+
+    return {
+        "total_policies": total_policies,
+        "active_policies": active_policies,
+        "completed_policies": 0,
+        "pending_policies": total_policies - active_policies,
+        "total_tasks": total_tasks,
+        "created_tasks": created_tasks,
+        "assigned_tasks": assigned_tasks,
+        "in_progress_tasks": in_progress_tasks,
+        "completed_tasks": completed_tasks,
+        "escalated_tasks": escalated_tasks
+    }
+
+async def seed(db):
+    print(f"Seeding {NUM_POLICIES} policies and {NUM_TASKS} tasks...")
+    await db.policies.drop()
+    await db.tasks.drop()
+
+    await db.policies.insert_many([
+        {"policy_id": f"BENCH-{i}", "status": "ACTIVE" if i % 10 else "ARCHIVED"}
+        for i in range(NUM_POLICIES)
+    ])
+
+    roles = ["Clerk", "Officer", "Admin"]
+    inserted = 0
+    while inserted < NUM_TASKS:
+        batch = []
+        for _ in range(min(BATCH_SIZE, NUM_TASKS - inserted)):
+            rule_no = random.randint(1, 50)
+            batch.append({
+                "task_id": str(uuid.uuid4()),
+                "policy_id": f"BENCH-{random.randrange(NUM_POLICIES)}",
+                "rule_id": f"R{rule_no}",
+                "task_name": f"Execute rule R{rule_no}",
+                "assigned_role": random.choice(roles),
+                "status": random.choice(TASK_STATUSES),
+                "deadline": "5 days"
+            })
+        await db.tasks.insert_many(batch, ordered=False)
+        inserted += len(batch)
+    print(f"   Seeded {inserted} tasks")
+
+async def time_it(label, fn, db):
+    timings = []
+    result = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        result = await fn(db)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    print(f"   {label:<28} best {timings[0] * 1000:8.1f}ms   median {timings[len(timings) // 2] * 1000:8.1f}ms")
+    return result
+
+async def bench_policy_stats():
+    client = AsyncIOMotorClient(BENCH_MONGO_URL)
+    db = client.get_database()
+    try:
+        if os.getenv("BENCH_SKIP_SEED") != "1":
+            await seed(db)
+
+        print(f"\nGET /policies/stats over {ROUNDS} rounds:")
+        legacy = await time_it("count_documents x8", legacy_policy_stats, db)
+        current = await time_it("$group x2 (concurrent)", compute_policy_stats, db)
+
+        if legacy == current:
+            print("\n✅ Both implementations return identical responses")
+        else:
+            print(f"\n❌ Response mismatch:\n   legacy:  {legacy}\n   current: {current}")
+    finally:
+        client.close()
+
+if __name__ == "__main__":
+    asyncio.run(bench_policy_stats())
@@ -0,0 +1,91 @@
+import gzip
+import os
+import time
+import uuid
+from datetime import datetime
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from app.responses import FastJSONResponse, orjson
+from app.schemas import TaskSchema
+from app.settings import GZIP_LEVEL
+
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "20"))
+
+def make_tasks(count):
+    return [
+        {
+            "task_id": str(uuid.uuid4()),
+            "policy_id": "BENCH-POLICY",
+            "file_name": "bench_policy.pdf",
+            "rule_id": f"R{i}",
+            "task_name": f"Execute rule R{i}",
+            "assigned_role": ["Clerk", "Officer", "Admin"][i % 3],
+            "status": "CREATED",
+            "deadline": "5 business days"
+        }
+        for i in range(count)
+    ]
+
+def make_audit_logs(count):
+    return [
+        {
+            "_id": uuid.uuid4().hex[:24],
+            "task_id": str(uuid.uuid4()),
+            "action": "STATUS_UPDATE: ASSIGNED -> IN_PROGRESS",
+            "performed_by_role": "Clerk",
+            "timestamp": "10:30"
+        }
+        for _ in range(count)
+    ]
+
+def make_nlp_result(num_rules):
+    return {
+        "_id": uuid.uuid4().hex[:24],
+        "result_id": str(uuid.uuid4()),
+        "policy_id": "BENCH-POLICY",
+        "file_name": "bench_policy.pdf",
+        "upload_timestamp": datetime.utcnow().isoformat(),
+        "status": "completed",
+        "nlp_data": {"rules": [
+            {"rule_id": f"R{i}", "action": "Verify applicant residency and income documents",
+             "responsible_role": "Clerk", "deadline": "5 business days"}
+            for i in range(num_rules)
+        ]}
+    }
+
+def cpu_ms(fn):
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.process_time()
+        body = fn()
+        best = min(best, time.process_time() - start)
+    return best * 1000, body
+
+def bench_serialization():
+    task_list = TypeAdapter(list[TaskSchema])
+    task_page = {"tasks": make_tasks(1000), "next_cursor": None}
+    cases = [
+        # (endpoint, content, default path)
+        ("GET /tasks (1000)", task_page,
+         lambda: JSONResponse(jsonable_encoder(task_page)).body),
+        ("POST /policies/ingest (1000)", task_page["tasks"],
+         lambda: task_list.dump_json(task_list.validate_python(task_page["tasks"]))),
+        ("GET /audit-logs (500)", make_audit_logs(500), None),
+        ("GET /nlp-results/{id} (5000 rules)", make_nlp_result(5000), None),
+    ]
+
+    print(f"Serialization CPU (best of {ROUNDS}) and bytes on the wire (gzip level {GZIP_LEVEL}):")
+    print(f"   {'endpoint':<36}{'default':>10}{'orjson':>10}{'raw KB':>10}{'gzip KB':>10}")
+    for name, content, default in cases:
+        if default is None:
+            default = lambda content=content: JSONResponse(jsonable_encoder(content)).body
+        default_ms, body = cpu_ms(default)
+        fast_ms = float("nan")
+        if orjson is not None:
+            fast_ms, _ = cpu_ms(lambda: FastJSONResponse(content).body)
+        compressed = gzip.compress(body, compresslevel=GZIP_LEVEL)
+        print(f"   {name:<36}{default_ms:>8.1f}ms{fast_ms:>8.1f}ms{len(body) / 1024:>10.1f}{len(compressed) / 1024:>10.1f}")
+
+if __name__ == "__main__":
+    bench_serialization()
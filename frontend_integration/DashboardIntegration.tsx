@@ -5,8 +5,25 @@
  * Adapt this code to your existing DashboardInteractive.tsx component.
  */
 
-import React, { useState, useEffect } from 'react';
-import { fetchTasks, updateTaskStatus, escalateTask, getTaskStatistics, Task } from './api';
+import React, { useState, useEffect, useRef } from 'react';
+import {
+    fetchTaskPage, getTaskStatistics, updateTaskStatus, escalateTask, subscribeToTaskEvents,
+    Task, TaskEvent, TaskStatistics
+} from './api';
+
+const EMPTY_STATISTICS: TaskStatistics = {
+    total: 0, created: 0, assigned: 0, inProgress: 0, completed: 0, escalated: 0,
+};
+
+// Tasks shown in the list: the first page, in task_id order like the API
+const TASK_PAGE_SIZE = 100;
+// Pushed changes refresh the statistics cards at most this often
+const STATISTICS_REFRESH_MS = 500;
+
+// Whether a task belongs in the list shown for a role
+function isVisibleTo(task: Task, role: string) {
+    return role.toLowerCase() === 'admin' || task.assigned_role.toLowerCase() === role.toLowerCase();
+}
 
 interface DashboardProps {
     currentUserRole: string; // "Clerk", "Officer", or "Admin"
@@ -18,33 +35,83 @@ export function DashboardInteractive({ currentUserRole }: DashboardProps) {
     const [isLoading, setIsLoading] = useState(true);
     const [error, setError] = useState<string | null>(null);
     const [selectedRole, setSelectedRole] = useState<string>(currentUserRole);
-    const [statistics, setStatistics] = useState({
-        total: 0,
-        created: 0,
-        assigned: 0,
-        inProgress: 0,
-        completed: 0,
-        escalated: 0,
-    });
-
-    // Load tasks when component mounts or role changes
+    // Counted server-side: the task list only holds the first page
+    const [statistics, setStatistics] = useState<TaskStatistics>(EMPTY_STATISTICS);
+    // Whether tasks exist beyond the loaded page
+    const hasMoreTasks = useRef(false);
+    const statisticsTimer = useRef<ReturnType<typeof setTimeout> | null>(null);
+
+    // Load tasks when component mounts or role changes, then apply pushed
+    // changes instead of refetching the whole list
     useEffect(() => {
         loadTasks();
+        const unsubscribe = subscribeToTaskEvents(selectedRole, applyTaskEvent);
+        return () => {
+            unsubscribe();
+            if (statisticsTimer.current !== null) {
+                clearTimeout(statisticsTimer.current);
+                statisticsTimer.current = null;
+            }
+        };
     }, [selectedRole]);
 
+    // Merge one pushed change into the task list
+    function applyTaskEvent(event: TaskEvent) {
+        if (event.type === 'resync' || !event.task) {
+            loadTasks();
+            return;
+        }
+        scheduleStatisticsRefresh();
+        const changed = event.task;
+        setTasks((current) => {
+            const others = current.filter((task) => task.task_id !== changed.task_id);
+            if (!isVisibleTo(changed, selectedRole)) {
+                return others;
+            }
+            const index = current.findIndex((task) => task.task_id === changed.task_id);
+            if (index !== -1) {
+                return current.map((task) => (task.task_id === changed.task_id ? changed : task));
+            }
+            // A new task only belongs here if it sorts into the loaded page
+            const last = current[current.length - 1];
+            if (hasMoreTasks.current && last && changed.task_id > last.task_id) {
+                return current;
+            }
+            const merged = [...current, changed].sort((a, b) => (a.task_id < b.task_id ? -1 : 1));
+            if (merged.length > TASK_PAGE_SIZE) {
+                hasMoreTasks.current = true;
+                return merged.slice(0, TASK_PAGE_SIZE);
+            }
+            return merged;
+        });
+    }
+
+    // Coalesce the statistics refreshes of a burst of events (e.g. a large
+    // ingest) into one request per STATISTICS_REFRESH_MS
+    function scheduleStatisticsRefresh() {
+        if (statisticsTimer.current !== null) {
+            return;
+        }
+        statisticsTimer.current = setTimeout(() => {
+            statisticsTimer.current = null;
+            loadStatistics();
+        }, STATISTICS_REFRESH_MS);
+    }
+
     // Load tasks from backend
     async function loadTasks() {
         try {
             setIsLoading(true);
             setError(null);
 
-            // Fetch tasks from backend
-            const fetchedTasks = await fetchTasks(selectedRole);
-            setTasks(fetchedTasks);
-
-            // Calculate statistics
-            const stats = await getTaskStatistics(selectedRole);
-            setStatistics(stats);
+            // Fetch the first page of tasks and the totals over all tasks
+            const [page, fetchedStatistics] = await Promise.all([
+                fetchTaskPage({ role: selectedRole, limit: TASK_PAGE_SIZE }),
+                getTaskStatistics(selectedRole),
+            ]);
+            hasMoreTasks.current = page.next_cursor !== null;
+            setTasks(page.tasks);
+            setStatistics(fetchedStatistics);
 
         } catch (err) {
             setError(err instanceof Error ? err.message : 'Failed to load tasks');
@@ -54,15 +121,21 @@ export function DashboardInteractive({ currentUserRole }: DashboardProps) {
         }
     }
 
+    // Refresh the statistics cards after a pushed change
+    async function loadStatistics() {
+        try {
+            setStatistics(await getTaskStatistics(selectedRole));
+        } catch (err) {
+            console.error('Error loading statistics:', err);
+        }
+    }
+
     // Handle task status update
     async function handleUpdateStatus(taskId: string, newStatus: Task['status']) {
         try {
-            // Update status on backend
+            // Update status on backend; the change arrives via the event stream
             await updateTaskStatus(taskId, newStatus, currentUserRole);
 
-            // Refresh tasks to show updated data
-            await loadTasks();
-
             // Optional: Show success message
             console.log(`Task ${taskId} updated to ${newStatus}`);
 
@@ -75,12 +148,9 @@ export function DashboardInteractive({ currentUserRole }: DashboardProps) {
     // Handle task escalation
     async function handleEscalate(taskId: string) {
         try {
-            // Escalate task on backend
+            // Escalate task on backend; the change arrives via the event stream
             await escalateTask(taskId, currentUserRole);
 
-            // Refresh tasks to show updated data
-            await loadTasks();
-
             // Optional: Show success message
             console.log(`Task ${taskId} escalated`);
 
@@ -35,18 +35,36 @@ export interface UpdateStatusRequest {
 
 // API Functions
 
+export interface TaskPage {
+    tasks: Task[];
+    next_cursor: string | null;
+}
+
+export interface TaskPageQuery {
+    role?: string;
+    status?: Task["status"];
+    policy_id?: string;
+    after?: string;
+    limit?: number;
+    fields?: (keyof Task)[];
+}
+
 /**
- * Fetch tasks from backend, optionally filtered by role
- * @param role - Optional role filter (e.g., "Clerk", "Officer", "Admin")
- * @returns Array of tasks
+ * Fetch one page of tasks from backend
+ * @param query - Optional filters, page cursor (`after`), page size and fields
+ * @returns Page of tasks plus the cursor of the next page (null on the last page)
  */
-export async function fetchTasks(role?: string): Promise<Task[]> {
+export async function fetchTaskPage(query: TaskPageQuery = {}): Promise<TaskPage> {
     try {
-        const url = role
-            ? `${BACKEND_URL}/tasks?role=${encodeURIComponent(role)}`
-            : `${BACKEND_URL}/tasks?role=Admin`; // Default to Admin to see all tasks
+        const params = new URLSearchParams();
+        params.set('role', query.role ?? 'Admin'); // Default to Admin to see all tasks
+        if (query.status) params.set('status', query.status);
+        if (query.policy_id) params.set('policy_id', query.policy_id);
+        if (query.after) params.set('after', query.after);
+        if (query.limit) params.set('limit', String(query.limit));
+        if (query.fields) params.set('fields', query.fields.join(','));
 
-        const response = await fetch(url, {
+        const response = await fetch(`${BACKEND_URL}/tasks?${params.toString()}`, {
             method: 'GET',
             headers: {
                 'Content-Type': 'application/json',
@@ -57,14 +75,25 @@ export async function fetchTasks(role?: string): Promise<Task[]> {
             throw new Error(`Failed to fetch tasks: ${response.status} ${response.statusText}`);
         }
 
-        const tasks: Task[] = await response.json();
-        return tasks;
+        const page: TaskPage = await response.json();
+        return page;
     } catch (error) {
         console.error('Error fetching tasks:', error);
         throw error;
     }
 }
 
+/**
+ * Fetch the first page of tasks from backend, optionally filtered by role
+ * @param role - Optional role filter (e.g., "Clerk", "Officer", "Admin")
+ * @param limit - Page size (backend default 100, max 1000)
+ * @returns Array of tasks
+ */
+export async function fetchTasks(role?: string, limit?: number): Promise<Task[]> {
+    const page = await fetchTaskPage({ role, limit });
+    return page.tasks;
+}
+
 /**
  * Update task status
  * @param taskId - Task ID to update
@@ -152,29 +181,45 @@ export async function checkBackendHealth(): Promise<{ status: string }> {
     }
 }
 
-/**
- * Get statistics for dashboard
- * @param role - Optional role filter
- * @returns Statistics object
- */
-export async function getTaskStatistics(role?: string): Promise<{
+export interface TaskStatistics {
     total: number;
     created: number;
     assigned: number;
     inProgress: number;
     completed: number;
     escalated: number;
-}> {
+}
+
+/**
+ * Get statistics for dashboard, counted server-side over every task
+ * (not just the first page of /tasks)
+ * @param role - Optional role filter
+ * @returns Statistics object
+ */
+export async function getTaskStatistics(role?: string): Promise<TaskStatistics> {
     try {
-        const tasks = await fetchTasks(role);
+        const params = new URLSearchParams();
+        if (role) params.set('role', role);
 
+        const response = await fetch(`${BACKEND_URL}/tasks/stats?${params.toString()}`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+        });
+
+        if (!response.ok) {
+            throw new Error(`Failed to fetch task statistics: ${response.status}`);
+        }
+
+        const stats: { total_tasks: number; tasks_by_status: Record<Task["status"], number> } = await response.json();
         return {
-            total: tasks.length,
-            created: tasks.filter(t => t.status === 'CREATED').length,
-            assigned: tasks.filter(t => t.status === 'ASSIGNED').length,
-            inProgress: tasks.filter(t => t.status === 'IN_PROGRESS').length,
-            completed: tasks.filter(t => t.status === 'COMPLETED').length,
-            escalated: tasks.filter(t => t.status === 'ESCALATED').length,
+            total: stats.total_tasks,
+            created: stats.tasks_by_status.CREATED,
+            assigned: stats.tasks_by_status.ASSIGNED,
+            inProgress: stats.tasks_by_status.IN_PROGRESS,
+            completed: stats.tasks_by_status.COMPLETED,
+            escalated: stats.tasks_by_status.ESCALATED,
         };
     } catch (error) {
         console.error('Error getting task statistics:', error);
@@ -182,5 +227,41 @@ export async function getTaskStatistics(role?: string): Promise<{
     }
 }
 
+export interface TaskEvent {
+    type: "task.created" | "task.updated" | "task.status_changed" | "task.escalated" | "resync";
+    task?: Task;
+    roles?: string[];
+    timestamp: string;
+    previous_status?: Task["status"];
+    previous_role?: string;
+}
+
+/**
+ * Subscribe to task changes pushed by the backend (Server-Sent Events)
+ * @param role - Only receive changes touching this role (Admin receives all)
+ * @param onEvent - Called for every event; on "resync" refetch the task list
+ * @returns Function that closes the subscription
+ */
+export function subscribeToTaskEvents(role: string | undefined, onEvent: (event: TaskEvent) => void): () => void {
+    const params = new URLSearchParams();
+    if (role) params.set('role', role);
+
+    const source = new EventSource(`${BACKEND_URL}/events?${params.toString()}`);
+    const eventTypes: TaskEvent["type"][] = [
+        'task.created', 'task.updated', 'task.status_changed', 'task.escalated', 'resync'
+    ];
+    for (const type of eventTypes) {
+        source.addEventListener(type, (message) => {
+            onEvent(JSON.parse((message as MessageEvent).data) as TaskEvent);
+        });
+    }
+    source.onerror = (error) => {
+        // EventSource reconnects on its own; events missed meanwhile need a refetch
+        console.error('Task event stream error:', error);
+    };
+
+    return () => source.close();
+}
+
 // Export backend URL for direct access if needed
 export { BACKEND_URL };
@@ -7,12 +7,13 @@ async def test_analytics():
     async with httpx.AsyncClient() as client:
         # 1. Test Performance
         print("\n1. Testing /analytics/performance...")
-        resp = await client.get(f"{BASE_URL}/analytics/performance")
-        if resp.status_code == 200:
-            data = resp.json()
-            print(f"   ✅ Success. Range: {data.get('range')}, Data Points: {len(data.get('data', []))}")
-        else:
-            print(f"   ❌ Failed: {resp.status_code}")
+        for range_key in ["24h", "7d", "30d", "365d"]:
+            resp = await client.get(f"{BASE_URL}/analytics/performance", params={"range": range_key})
+            if resp.status_code == 200:
+                data = resp.json()
+                print(f"   ✅ Success. Range: {data.get('range')}, Data Points: {len(data.get('data', []))}")
+            else:
+                print(f"   ❌ Failed: {resp.status_code}")
 
         # 2. Test Storage
         print("\n2. Testing /system/storage...")
@@ -20,6 +21,8 @@ async def test_analytics():
         if resp.status_code == 200:
             data = resp.json()
             print(f"   ✅ Success. Total: {data.get('total_storage_gb')}GB, Used: {data.get('used_storage_gb')}GB")
+            for alert in data.get('alerts', []):
+                print(f"   ⚠️ {alert['message']}")
         else:
             print(f"   ❌ Failed: {resp.status_code}")
 
@@ -29,7 +32,15 @@ async def test_analytics():
         if resp.status_code == 200:
             data = resp.json()
             metrics = data.get('metrics', [])
-            print(f"   ✅ Success. Metrics: {[m['name'] for m in metrics]}")
+            print(f"   ✅ Success. Metrics: {[(m['name'], m['value']) for m in metrics]}")
+        else:
+            print(f"   ❌ Failed: {resp.status_code}")
+
+        # 4. Test Prometheus metrics
+        print("\n4. Testing /metrics...")
+        resp = await client.get(f"{BASE_URL}/metrics")
+        if resp.status_code == 200 and "http_requests_total" in resp.text:
+            print(f"   ✅ Success. {len(resp.text.splitlines())} lines")
         else:
             print(f"   ❌ Failed: {resp.status_code}")
 
@@ -0,0 +1,177 @@
+import asyncio
+import httpx
+import uuid
+
+BASE_URL = "http://localhost:8000"
+CONCURRENCY = 50
+
+async def test_concurrent_transitions():
+    policy_id = f"TEST-RACE-{uuid.uuid4().hex[:8]}"
+    print(f"Testing with Policy ID: {policy_id}")
+
+    payload = {
+        "policy_id": policy_id,
+        "rules": [{"rule_id": "R1", "action": "Contended action", "responsible_role": "Clerk"}]
+    }
+
+    async with httpx.AsyncClient(timeout=30) as client:
+        # 1. Create a single task
+        print("\n1. Ingesting Policy...")
+        response = await client.post(f"{BASE_URL}/policies/ingest", json=payload)
+        if response.status_code != 200:
+            print(f"❌ Ingest failed: {response.text}")
+            return
+        task_id = response.json()[0]["task_id"]
+        print(f"   Task created: {task_id}")
+
+        # 2. Hammer the same CREATED -> ASSIGNED transition from many coroutines
+        print(f"\n2. Sending {CONCURRENCY} concurrent CREATED -> ASSIGNED updates...")
+        responses = await asyncio.gather(*[
+            client.post(
+                f"{BASE_URL}/tasks/{task_id}/update-status",
+                json={"new_status": "ASSIGNED", "role": f"Clerk-{i}"}
+            )
+            for i in range(CONCURRENCY)
+        ])
+        succeeded = [r for r in responses if r.status_code == 200]
+        rejected = [r for r in responses if r.status_code == 400]
+        print(f"   Succeeded: {len(succeeded)} (Expected: 1)")
+        print(f"   Rejected:  {len(rejected)} (Expected: {CONCURRENCY - 1})")
+
+        # 3. Hammer escalation: each request escalates one level, so only
+        #    Clerk -> Officer and Officer -> Admin can ever succeed
+        print(f"\n3. Sending {CONCURRENCY} concurrent escalations...")
+        escalations = await asyncio.gather(*[
+            client.post(f"{BASE_URL}/tasks/{task_id}/escalate", json={"role": "Clerk"})
+            for _ in range(CONCURRENCY)
+        ])
+        escalated = [r for r in escalations if r.status_code == 200]
+        print(f"   Succeeded: {len(escalated)} (Expected: 2)")
+
+        # 4. Exactly one audit entry per successful transition
+        logs = (await client.get(f"{BASE_URL}/audit-logs", params={"limit": 500})).json()
+        task_logs = [l for l in logs if l["task_id"] == task_id]
+        status_logs = [l for l in task_logs if l["action"].startswith("STATUS_UPDATE")]
+        escalation_logs = [l for l in task_logs if l["action"].startswith("ESCALATION")]
+        print(f"\n4. Audit entries: {len(status_logs)} status updates, {len(escalation_logs)} escalations")
+
+        final_task = (await client.get(f"{BASE_URL}/tasks", params={"policy_id": policy_id})).json()["tasks"][0]
+        print(f"   Final role: {final_task['assigned_role']} (Expected: Admin)")
+
+        assert len(succeeded) == 1
+        assert len(rejected) == CONCURRENCY - 1
+        assert len(escalated) == 2
+        assert len(status_logs) == 1
+        assert len(escalation_logs) == 2
+        assert final_task["assigned_role"] == "Admin"
+
+        print("\n✅ VERIFICATION SUCCESSFUL!")
+
+RACE_TASKS = 20
+
+async def test_single_vs_bulk_race():
+    policy_id = f"TEST-BULK-RACE-{uuid.uuid4().hex[:8]}"
+    print(f"\nTesting single vs bulk updates with Policy ID: {policy_id}")
+
+    payload = {
+        "policy_id": policy_id,
+        "rules": [
+            {"rule_id": f"R{i}", "action": "Contended action", "responsible_role": "Clerk"}
+            for i in range(RACE_TASKS)
+        ]
+    }
+
+    async with httpx.AsyncClient(timeout=30) as client:
+        # 1. Create the tasks
+        print("\n1. Ingesting Policy...")
+        response = await client.post(f"{BASE_URL}/policies/ingest", json=payload)
+        task_ids = [task["task_id"] for task in response.json()]
+        print(f"   Tasks created: {len(task_ids)}")
+
+        # 2. Race one bulk CREATED -> ASSIGNED against single updates of every task
+        print("\n2. Racing a bulk update against single updates of the same tasks...")
+        bulk, *singles = await asyncio.gather(
+            client.post(
+                f"{BASE_URL}/tasks/bulk-update-status",
+                json={"policy_id": policy_id, "new_status": "ASSIGNED", "role": "Admin"}
+            ),
+            *[
+                client.post(
+                    f"{BASE_URL}/tasks/{task_id}/update-status",
+                    json={"new_status": "ASSIGNED", "role": "Clerk"}
+                )
+                for task_id in task_ids
+            ]
+        )
+        bulk_succeeded = {r["task_id"] for r in bulk.json()["results"] if r["success"]}
+        single_succeeded = {task_id for task_id, r in zip(task_ids, singles) if r.status_code == 200}
+        print(f"   Bulk applied {len(bulk_succeeded)}, single applied {len(single_succeeded)}")
+
+        # 3. Every task moved exactly once: one winner, one audit entry, counted once
+        logs = (await client.get(f"{BASE_URL}/audit-logs", params={"limit": 500})).json()
+        status_logs = [l for l in logs if l["task_id"] in task_ids and l["action"].startswith("STATUS_UPDATE")]
+        stats = (await client.get(f"{BASE_URL}/policies/stats/{policy_id}")).json()
+        print(f"\n3. Audit entries: {len(status_logs)}, counted by status: {stats['tasks_by_status']}")
+
+        assert not bulk_succeeded & single_succeeded
+        assert bulk_succeeded | single_succeeded == set(task_ids)
+        assert len(status_logs) == RACE_TASKS
+        assert stats["tasks_by_status"]["ASSIGNED"] == RACE_TASKS
+        assert stats["tasks_by_status"]["CREATED"] == 0
+
+        print("\n✅ VERIFICATION SUCCESSFUL!")
+
+async def test_bulk_escalate_vs_single_race():
+    policy_id = f"TEST-ESCALATE-RACE-{uuid.uuid4().hex[:8]}"
+    print(f"\nTesting bulk escalation vs single updates with Policy ID: {policy_id}")
+
+    payload = {
+        "policy_id": policy_id,
+        "rules": [
+            {"rule_id": f"R{i}", "action": "Contended action", "responsible_role": "Clerk"}
+            for i in range(RACE_TASKS)
+        ]
+    }
+
+    async with httpx.AsyncClient(timeout=30) as client:
+        # 1. Create the tasks
+        print("\n1. Ingesting Policy...")
+        response = await client.post(f"{BASE_URL}/policies/ingest", json=payload)
+        task_ids = [task["task_id"] for task in response.json()]
+        print(f"   Tasks created: {len(task_ids)}")
+
+        # 2. Race one bulk escalation against single CREATED -> ASSIGNED updates,
+        #    which change the status but not the role
+        print("\n2. Racing a bulk escalation against single updates of the same tasks...")
+        bulk, *singles = await asyncio.gather(
+            client.post(f"{BASE_URL}/tasks/bulk-escalate", json={"policy_id": policy_id, "role": "Admin"}),
+            *[
+                client.post(
+                    f"{BASE_URL}/tasks/{task_id}/update-status",
+                    json={"new_status": "ASSIGNED", "role": "Clerk"}
+                )
+                for task_id in task_ids
+            ]
+        )
+        bulk_succeeded = {r["task_id"] for r in bulk.json()["results"] if r["success"]}
+        single_succeeded = {task_id for task_id, r in zip(task_ids, singles) if r.status_code == 200}
+        print(f"   Bulk escalated {len(bulk_succeeded)}, single applied {len(single_succeeded)}")
+
+        # 3. Every task changed exactly once and is counted in its final status
+        stats = (await client.get(f"{BASE_URL}/policies/stats/{policy_id}")).json()
+        print(f"\n3. Counted by status: {stats['tasks_by_status']}")
+
+        assert not bulk_succeeded & single_succeeded
+        assert bulk_succeeded | single_succeeded == set(task_ids)
+        assert stats["tasks_by_status"]["ESCALATED"] == len(bulk_succeeded)
+        assert stats["tasks_by_status"]["ASSIGNED"] == len(single_succeeded)
+
+        print("\n✅ VERIFICATION SUCCESSFUL!")
+
+async def main():
+    await test_concurrent_transitions()
+    await test_single_vs_bulk_race()
+    await test_bulk_escalate_vs_single_race()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,49 @@
+import asyncio
+import httpx
+import uuid
+from app.db import get_db, close
+
+BASE_URL = "http://localhost:8000"
+
+async def test_legacy_escalation():
+    # Needs the same MONGO_URL as the running server
+    db = get_db()
+    policy_id = f"TEST-LEGACY-{uuid.uuid4().hex[:8]}"
+    task_id = str(uuid.uuid4())
+    print(f"Testing with Policy ID: {policy_id}")
+
+    # 1. A task written before assigned_role_key existed, with untrimmed role
+    print("\n1. Inserting a task without assigned_role_key...")
+    await db.tasks.insert_one({
+        "task_id": task_id, "policy_id": policy_id, "rule_id": "R1", "task_name": "Execute rule R1",
+        "assigned_role": " Clerk ", "status": "IN_PROGRESS", "deadline": "Not specified"
+    })
+
+    async with httpx.AsyncClient() as client:
+        # 2. Single escalation works from the role alone
+        print("\n2. Escalating the legacy task...")
+        response = await client.post(f"{BASE_URL}/tasks/{task_id}/escalate", json={"role": "Clerk"})
+        print(f"   Status: {response.status_code}, role: {response.json().get('assigned_role')}")
+        assert response.status_code == 200
+        assert response.json()["assigned_role"] == "Officer"
+
+        stored = await db.tasks.find_one({"task_id": task_id})
+        print(f"   Stored key: {stored.get('assigned_role_key')}")
+        assert stored["assigned_role_key"] == "officer"
+
+        # 3. Bulk escalation agrees with the single endpoint on the next step
+        print("\n3. Bulk-escalating the same task...")
+        response = await client.post(
+            f"{BASE_URL}/tasks/bulk-escalate", json={"task_ids": [task_id], "role": "Officer"}
+        )
+        result = response.json()["results"][0]
+        print(f"   Result: {result}")
+        assert result["success"] and result["assigned_role"] == "Admin"
+
+    await db.tasks.delete_many({"policy_id": policy_id})
+    await db.audit_logs.delete_many({"task_id": task_id})
+    close()
+    print("\n✅ VERIFICATION SUCCESSFUL!")
+
+if __name__ == "__main__":
+    asyncio.run(test_legacy_escalation())
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import uuid
+from datetime import datetime
+
+# Needs a local replica set with at least one secondary, e.g.
+#   mongod --replSet rs0 --port 27017 / 27018 / 27019, then rs.initiate(...)
+REPLICA_SET_URL = os.getenv(
+    "REPLICA_SET_URL",
+    "mongodb://localhost:27017,localhost:27018,localhost:27019/read_routing_test?replicaSet=rs0"
+)
+os.environ["MONGO_URL"] = REPLICA_SET_URL
+
+from pymongo import monitoring
+
+
+class CommandRecorder(monitoring.CommandListener):
+    """Remembers which server every command was sent to."""
+
+    def __init__(self):
+        self.commands = []
+
+    def started(self, event):
+        host, port = event.connection_id
+        self.commands.append((event.command_name, f"{host}:{port}"))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+    def servers_for(self, *command_names):
+        return {server for name, server in self.commands if name in command_names}
+
+
+recorder = CommandRecorder()
+monitoring.register(recorder)
+
+from app.db import get_db, get_analytics_db, close
+from app.counters import read_single_policy_stats
+from app.stats import compute_policy_stats
+
+async def test_read_routing():
+    db = get_db()
+    analytics_db = get_analytics_db()
+
+    hello = await db.client.admin.command("hello")
+    primary = hello["primary"]
+    secondaries = set(hello["hosts"]) - {primary}
+    print(f"\n1. Replica set {hello['setName']}: primary {primary}, secondaries {sorted(secondaries)}")
+    assert secondaries, "The replica set needs at least one secondary"
+    print(f"   Analytics read preference: {analytics_db.read_preference}")
+    assert analytics_db.read_preference.mode != 0
+
+    # 2. Writes and task reads go to the primary
+    print("\n2. Writing a task and reading it back...")
+    policy_id = f"TEST-ROUTING-{uuid.uuid4().hex[:8]}"
+    task_id = str(uuid.uuid4())
+    recorder.commands.clear()
+    await db.tasks.insert_one({
+        "task_id": task_id, "policy_id": policy_id, "rule_id": "R1", "task_name": "Execute rule R1",
+        "assigned_role": "Clerk", "assigned_role_key": "clerk", "status": "CREATED",
+        "deadline": "Not specified", "created_at": datetime.utcnow()
+    })
+    task = await db.tasks.find_one({"task_id": task_id})
+    assert task is not None, "Read-your-writes failed on the primary"
+    print(f"   insert sent to {recorder.servers_for('insert')}, find sent to {recorder.servers_for('find')}")
+    assert recorder.servers_for("insert", "find") == {primary}
+
+    # 3. Analytics and history reads go to a secondary
+    print("\n3. Running analytics and history reads...")
+    recorder.commands.clear()
+    await compute_policy_stats(analytics_db)
+    await analytics_db.audit_logs.find().sort("timestamp", -1).limit(20).to_list(length=20)
+    await read_single_policy_stats(analytics_db, policy_id)
+    await analytics_db.nlp_results.find({}, {"nlp_data": 0}).limit(50).to_list(length=50)
+    servers = recorder.servers_for("aggregate", "find")
+    print(f"   analytics reads sent to {servers}")
+    assert servers and servers <= secondaries
+
+    # 4. Causal session: a secondary read observes the session's own write
+    print("\n4. Reading a fresh write from a secondary inside a causal session...")
+    async with await db.client.start_session(causal_consistency=True) as session:
+        await db.tasks.update_one({"task_id": task_id}, {"$set": {"status": "ASSIGNED"}}, session=session)
+        recorder.commands.clear()
+        task = await analytics_db.tasks.find_one({"task_id": task_id}, session=session)
+    print(f"   find sent to {recorder.servers_for('find')}, status {task['status']}")
+    assert recorder.servers_for("find") <= secondaries
+    assert task["status"] == "ASSIGNED"
+
+    await db.tasks.delete_many({"policy_id": policy_id})
+    close()
+    print("\n✅ VERIFICATION SUCCESSFUL!")
+
+if __name__ == "__main__":
+    asyncio.run(test_read_routing())
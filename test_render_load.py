@@ -0,0 +1,71 @@
+import asyncio
+import time
+import uuid
+import httpx
+
+BASE_URL = "http://localhost:8000"
+RULES_PER_REPORT = 2000
+CONCURRENT_RENDERS = 8
+LATENCY_SAMPLES = 200
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+async def sample_tasks_latency(client, samples):
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        response = await client.get(f"{BASE_URL}/tasks", params={"limit": 50})
+        timings.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200
+    return timings
+
+async def test_render_load():
+    async with httpx.AsyncClient(timeout=120) as client:
+        # 1. Save large NLP results; distinct file names defeat the PDF cache
+        print(f"\n1. Saving {CONCURRENT_RENDERS} results with {RULES_PER_REPORT} rules each...")
+        rules = [
+            {"rule_id": f"R{i}", "action": f"Verify supporting document set {i} " * 4,
+             "responsible_role": "Clerk", "deadline": "5 days"}
+            for i in range(RULES_PER_REPORT)
+        ]
+        result_ids = []
+        for i in range(CONCURRENT_RENDERS):
+            response = await client.post(f"{BASE_URL}/nlp-results/save", json={
+                "policy_id": f"TEST-LOAD-{uuid.uuid4().hex[:8]}",
+                "file_name": f"load_{i}.pdf",
+                "nlp_data": {"rules": rules}
+            })
+            result_ids.append(response.json()["result_id"])
+
+        # 2. Baseline /tasks latency
+        print("\n2. Measuring /tasks latency at rest...")
+        baseline = await sample_tasks_latency(client, LATENCY_SAMPLES)
+
+        # 3. /tasks latency while the reports render
+        print(f"\n3. Measuring /tasks latency during {CONCURRENT_RENDERS} concurrent renders...")
+        downloads = [
+            asyncio.create_task(client.get(f"{BASE_URL}/nlp-results/{result_id}/download-pdf"))
+            for result_id in result_ids
+        ]
+        await asyncio.sleep(0.1)
+        under_load = await sample_tasks_latency(client, LATENCY_SAMPLES)
+        responses = await asyncio.gather(*downloads)
+
+        rendered = sum(1 for r in responses if r.status_code == 200)
+        shed = sum(1 for r in responses if r.status_code == 503)
+        print(f"   PDFs rendered: {rendered}, rejected with 503: {shed}")
+
+        print("\n📊 /tasks latency (ms):")
+        print(f"   at rest:    p50 {percentile(baseline, 50):7.1f}   p99 {percentile(baseline, 99):7.1f}")
+        print(f"   rendering:  p50 {percentile(under_load, 50):7.1f}   p99 {percentile(under_load, 99):7.1f}")
+
+        # p99 should stay flat: allow generous noise, but not a render-sized stall
+        assert percentile(under_load, 99) < max(3 * percentile(baseline, 99), percentile(baseline, 99) + 100)
+        assert rendered + shed == CONCURRENT_RENDERS
+
+        print("\n✅ VERIFICATION SUCCESSFUL!")
+
+if __name__ == "__main__":
+    asyncio.run(test_render_load())
@@ -17,8 +17,8 @@ async def test_reset_db():
         await client.post(f"{BASE_URL}/policies/ingest", json=payload_a)
         
         # Verify Policy A exists
-        tasks = (await client.get(f"{BASE_URL}/tasks")).json()
-        count_a = len([t for t in tasks if t['policy_id'] == policy_id_a])
+        tasks = (await client.get(f"{BASE_URL}/tasks", params={"policy_id": policy_id_a})).json()["tasks"]
+        count_a = len(tasks)
         print(f"   Tasks for Policy A: {count_a}")
         assert count_a > 0
 
@@ -36,14 +36,14 @@ async def test_reset_db():
         
         # 3. Verify Data
         print("\n3. Verifying Data...")
-        tasks = (await client.get(f"{BASE_URL}/tasks")).json()
-        
         # Check Policy A is gone
-        count_a = len([t for t in tasks if t['policy_id'] == policy_id_a])
+        tasks = (await client.get(f"{BASE_URL}/tasks", params={"policy_id": policy_id_a})).json()["tasks"]
+        count_a = len(tasks)
         print(f"   Tasks for Policy A: {count_a} (Expected: 0)")
         
         # Check Policy B exists
-        count_b = len([t for t in tasks if t['policy_id'] == policy_id_b])
+        tasks = (await client.get(f"{BASE_URL}/tasks", params={"policy_id": policy_id_b})).json()["tasks"]
+        count_b = len(tasks)
         print(f"   Tasks for Policy B: {count_b} (Expected: 1)")
         
         if count_a == 0 and count_b == 1: